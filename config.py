@@ -10,7 +10,7 @@ load_dotenv(env_path)
 
 def get_env(name: str, default: str = None) -> str:
     """Get environment variable with optional default."""
-    value = os.getenv(name, default)
+    value = os.environ.get(name, default)
     if value is None:
         raise RuntimeError(f"Missing required environment variable: {name}")
     return value
@@ -21,18 +21,22 @@ ZOOM_CLIENT_ID = get_env("ZOOM_CLIENT_ID")
 ZOOM_CLIENT_SECRET = get_env("ZOOM_CLIENT_SECRET")
 ZOOM_REDIRECT_URI = get_env("ZOOM_REDIRECT_URI", "http://localhost:8080/redirect")
 ZOOM_USER_ID = get_env("ZOOM_USER_ID")
-ZOOM_REFRESH_TOKEN_FILE = Path(".zoom_refresh_token").resolve()
+ZOOM_REFRESH_TOKEN_FILE = Path(".zoom_refresh_token").absolute()
 
 # YouTube OAuth settings
 YOUTUBE_CLIENT_ID = get_env("YOUTUBE_CLIENT_ID")
 YOUTUBE_CLIENT_SECRET = get_env("YOUTUBE_CLIENT_SECRET")
-YOUTUBE_TOKEN_FILE = Path("youtube_token.json").resolve()
+YOUTUBE_TOKEN_FILE = Path("youtube_token.json").absolute()
 YOUTUBE_DEFAULT_DESCRIPTION = get_env("YOUTUBE_DEFAULT_DESCRIPTION", "Uploaded via automation")
 YOUTUBE_DEFAULT_TAGS = get_env("YOUTUBE_DEFAULT_TAGS", "zoom,meeting,recording")
+# Parsed once at import; shared by every upload, so callers must not mutate it
+YOUTUBE_DEFAULT_TAGS_LIST = [t.strip() for t in YOUTUBE_DEFAULT_TAGS.split(",") if t.strip()]
 YOUTUBE_CATEGORY_ID = get_env("YOUTUBE_CATEGORY_ID", "22")
+# Resumable upload chunk size in MiB (larger = fewer round trips, more memory per upload)
+YOUTUBE_UPLOAD_CHUNK_SIZE = max(1, int(get_env("YOUTUBE_UPLOAD_CHUNK_SIZE_MB", "16"))) * 1024 * 1024
 # Optional: Pre-select a specific Google account (email address)
 # This helps when you have multiple Google accounts logged in
-YOUTUBE_LOGIN_HINT = os.getenv("YOUTUBE_LOGIN_HINT", None)
+YOUTUBE_LOGIN_HINT = os.environ.get("YOUTUBE_LOGIN_HINT")
 
 # Discord webhook settings
 DISCORD_WEBHOOK_URL = get_env("DISCORD_WEBHOOK_URL")
@@ -42,11 +46,18 @@ LAST_MEETINGS_TO_PROCESS = int(get_env("LAST_MEETINGS_TO_PROCESS", "3"))
 MIN_VIDEO_LENGTH_SECONDS = int(get_env("MIN_VIDEO_LENGTH_SECONDS", "60"))
 VIDEO_RETENTION_DAYS = int(get_env("VIDEO_RETENTION_DAYS", "10"))
 ERROR_NOTIFICATION_THRESHOLD = int(get_env("ERROR_NOTIFICATION_THRESHOLD", "3"))
+# Number of recordings processed concurrently (1 = sequential)
+PARALLEL_WORKERS = max(1, int(get_env("PARALLEL_WORKERS", "3")))
+# Number of days to look back from today when fetching recordings
+RECORDINGS_DATE_RANGE_DAYS = int(get_env("RECORDINGS_DATE_RANGE_DAYS", "365"))
+# Folder name template for meeting directories (also used as the YouTube title)
+# Available placeholders: {date}, {time}, {date_time}, {topic}
+FOLDER_NAME_TEMPLATE = get_env("FOLDER_NAME_TEMPLATE", "{date} {time} - {topic}")
 
 # Paths
-DOWNLOAD_DIR = Path(get_env("DOWNLOAD_DIR", "./downloaded_videos")).resolve()
-CSV_TRACKER_PATH = Path(get_env("CSV_TRACKER_PATH", "./processed_recordings.csv")).resolve()
-LOG_FILE = Path(get_env("LOG_FILE", "./zoom_to_youtube.log")).resolve()
+DOWNLOAD_DIR = Path(get_env("DOWNLOAD_DIR", "./downloaded_videos")).absolute()
+CSV_TRACKER_PATH = Path(get_env("CSV_TRACKER_PATH", "./processed_recordings.csv")).absolute()
+LOG_FILE = Path(get_env("LOG_FILE", "./zoom_to_youtube.log")).absolute()
 
 # Ensure download directory exists
 DOWNLOAD_DIR.mkdir(parents=True, exist_ok=True)
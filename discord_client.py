@@ -3,39 +3,78 @@ import logging
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import config
 
 logger = logging.getLogger(__name__)
 
+# Shared session so repeated webhook posts reuse one keep-alive TLS connection.
+# POSTs are retried only when Discord cannot have created the message:
+# connection failures before the request is sent, and 429/503 responses.
+# Read errors (including the read timeout) are never retried, since the
+# message has usually been posted already and a retry would duplicate it.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=4,
+    max_retries=Retry(
+        total=3,
+        connect=3,
+        read=0,
+        status=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 503],
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False,
+    ),
+))
 
-def send_notification(youtube_url: str) -> bool:
+
+def _post(content: str, label: str) -> bool:
     """
-    Send a Discord notification with YouTube link.
+    Post a message to the configured Discord webhook.
     
     Args:
-        youtube_url: YouTube video URL to post
+        content: Message text to post
+        label: What is being sent, used in the failure log message
     
     Returns:
         True if successful, False otherwise
     """
-    # Format Discord message - modify this line to change message format
-    message = f"{youtube_url}"
-    
     try:
-        response = requests.post(
+        response = _session.post(
             config.DISCORD_WEBHOOK_URL,
-            json={"content": message},
+            json={"content": content},
             timeout=10
         )
         response.raise_for_status()
-        logger.info(f"Discord notification sent: {youtube_url}")
         return True
     except Exception as e:
-        logger.error(f"Failed to send Discord notification: {e}")
+        logger.error(f"Failed to send {label}: {e}")
         return False
 
 
+def send_notification(youtube_url: str) -> bool:
+    """
+    Send a Discord notification with YouTube link.
+    
+    Args:
+        youtube_url: YouTube video URL to post
+    
+    Returns:
+        True if successful, False otherwise
+    """
+    # Format Discord message - modify this line to change message format
+    message = f"{youtube_url}"
+    
+    if not _post(message, "Discord notification"):
+        return False
+    logger.info(f"Discord notification sent: {youtube_url}")
+    return True
+
+
 def send_error_notification(error_message: str, error_details: Optional[str] = None) -> bool:
     """
     Send a Discord notification for errors (e.g., token expiration).
@@ -52,16 +91,7 @@ def send_error_notification(error_message: str, error_details: Optional[str] = N
     if error_details:
         message += f"\n```\n{error_details}\n```"
     
-    try:
-        response = requests.post(
-            config.DISCORD_WEBHOOK_URL,
-            json={"content": message},
-            timeout=10
-        )
-        response.raise_for_status()
-        logger.info(f"Discord error notification sent: {error_message}")
-        return True
-    except Exception as e:
-        logger.error(f"Failed to send Discord error notification: {e}")
+    if not _post(message, "Discord error notification"):
         return False
-
+    logger.info(f"Discord error notification sent: {error_message}")
+    return True
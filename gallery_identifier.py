@@ -3,6 +3,18 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Recording types usable as the uploaded video, best first (lower rank wins)
+VIDEO_TYPE_PRIORITY = {
+    "shared_screen_with_gallery_view": 0,  # preferred
+    "gallery_view": 1,
+    "active_speaker": 2,  # fallback when no Gallery View exists
+    "shared_screen_with_speaker_view": 3,
+}
+
+UNRANKED = len(VIDEO_TYPE_PRIORITY)
+
+GALLERY_VIEW_TYPES = frozenset({"gallery_view", "shared_screen_with_gallery_view"})
+
 
 def is_gallery_view(recording_file):
     """
@@ -17,7 +29,12 @@ def is_gallery_view(recording_file):
     recording_type = recording_file.get("recording_type", "").lower()
     
     # Check for gallery view types
-    return recording_type in ["gallery_view", "shared_screen_with_gallery_view"]
+    return recording_type in GALLERY_VIEW_TYPES
+
+
+def _priority_rank(recording_file):
+    """Rank a recording file by VIDEO_TYPE_PRIORITY; unsupported types get UNRANKED."""
+    return VIDEO_TYPE_PRIORITY.get(recording_file.get("recording_type", "").lower(), UNRANKED)
 
 
 def find_best_gallery_view_file(recording_files):
@@ -32,37 +49,18 @@ def find_best_gallery_view_file(recording_files):
     Returns:
         Best video file (Gallery View preferred, speaker view as fallback), or None if not found
     """
-    # First, try to find shared_screen_with_gallery_view (preferred)
-    for file in recording_files:
-        recording_type = file.get("recording_type", "").lower()
-        if recording_type == "shared_screen_with_gallery_view":
-            logger.debug(f"Found preferred Gallery View: shared_screen_with_gallery_view")
-            return file
+    # min() keeps the first file among equally ranked ones
+    best_file = min(recording_files, key=_priority_rank, default=None)
+    if best_file is not None and _priority_rank(best_file) == UNRANKED:
+        best_file = None
     
-    # Fall back to gallery_view
-    for file in recording_files:
-        recording_type = file.get("recording_type", "").lower()
-        if recording_type == "gallery_view":
-            logger.debug(f"Found Gallery View: gallery_view")
-            return file
-    
-    # Fall back to active_speaker if no Gallery View found
-    for file in recording_files:
-        recording_type = file.get("recording_type", "").lower()
-        if recording_type == "active_speaker":
-            logger.debug(f"Found fallback: active_speaker")
-            return file
-    
-    # Also check for shared_screen_with_speaker_view as fallback
-    for file in recording_files:
-        recording_type = file.get("recording_type", "").lower()
-        if recording_type == "shared_screen_with_speaker_view":
-            logger.debug(f"Found fallback: shared_screen_with_speaker_view")
-            return file
+    if best_file is None:
+        # No suitable video file found
+        logger.debug("No Gallery View or Speaker View file found")
+        return None
     
-    # No suitable video file found
-    logger.debug("No Gallery View or Speaker View file found")
-    return None
+    logger.debug(f"Found best video: {best_file.get('recording_type')}")
+    return best_file
 
 
 def find_all_gallery_view_files(recording_files):
@@ -1,26 +1,38 @@
 """Main orchestrator for Zoom to YouTube automation."""
 import argparse
+import atexit
 import logging
+import queue
 import sys
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 import config
 import discord_client
-import youtube_client
 import zoom_client
 from video_manager import cleanup_old_videos
 from video_tracker import VideoTracker
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(config.LOG_FILE),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Configure logging: log calls only enqueue records, a background listener
+# thread does the file and console writes.
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler(config.LOG_FILE)
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(_log_formatter)
+
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, _file_handler, _stream_handler, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# Handlers attached directly: basicConfig would give the QueueHandler a
+# formatter and the listener's handlers would format each record twice.
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(QueueHandler(_log_queue))
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +49,13 @@ def _send_error_notification(zoom_uuid: str, meeting_topic: str, error_message:
         logger.warning(f"Failed to send Discord error notification: {e}")
 
 
+def _record_failure(tracker: VideoTracker, zoom_uuid: str, meeting_topic: str, error_message: str) -> None:
+    """Record an error in the tracker and notify Discord once it repeats often enough."""
+    should_notify = tracker.record_error(zoom_uuid, error_message)
+    if should_notify:
+        _send_error_notification(zoom_uuid, meeting_topic, error_message)
+
+
 def _send_success_notification(zoom_uuid: str, meeting_topic: str, operation: str) -> None:
     """Send Discord notification when an error is resolved."""
     try:
@@ -49,7 +68,11 @@ def _send_success_notification(zoom_uuid: str, meeting_topic: str, operation: st
         logger.warning(f"Failed to send Discord success notification: {e}")
 
 
-def process_recording(recording: dict, tracker: VideoTracker, dry_run: bool = False) -> None:
+def process_recording(
+    recording: dict,
+    tracker: VideoTracker,
+    dry_run: bool = False
+) -> None:
     """
     Process a single recording: download, upload, notify.
     
@@ -59,20 +82,20 @@ def process_recording(recording: dict, tracker: VideoTracker, dry_run: bool = Fa
         dry_run: If True, skip actual operations
     """
     zoom_uuid = recording.get('uuid', '')
-    meeting_topic = recording.get('topic', 'Untitled Meeting')
-    start_time = recording.get('start_time', '')
-    
     if not zoom_uuid:
         logger.warning("Recording missing UUID, skipping")
         return
     
-    logger.info(f"Processing recording: {meeting_topic} ({zoom_uuid[:8]}...)")
-    
-    # Check if already fully processed
+    # Check if already fully processed (the common case on re-runs)
     if tracker.is_processed(zoom_uuid):
-        logger.info(f"Already fully processed, skipping: {zoom_uuid[:8]}...")
+        logger.debug(f"Already fully processed, skipping: {zoom_uuid[:8]}...")
         return
     
+    meeting_topic = recording.get('topic', 'Untitled Meeting')
+    start_time = recording.get('start_time', '')
+    
+    logger.info(f"Processing recording: {meeting_topic} ({zoom_uuid[:8]}...)")
+    
     # Get existing record if any
     existing_record = tracker.get_record(zoom_uuid)
     
@@ -80,9 +103,7 @@ def process_recording(recording: dict, tracker: VideoTracker, dry_run: bool = Fa
     recording_files = recording.get('recording_files', [])
     if not recording_files:
         logger.warning(f"No recording files found for {meeting_topic}")
-        should_notify = tracker.record_error(zoom_uuid, "No recording files found")
-        if should_notify:
-            _send_error_notification(zoom_uuid, meeting_topic, "No recording files found")
+        _record_failure(tracker, zoom_uuid, meeting_topic, "No recording files found")
         return
     
     # Debug: log available recording types
@@ -95,129 +116,194 @@ def process_recording(recording: dict, tracker: VideoTracker, dry_run: bool = Fa
         # Log more details when no suitable video found
         logger.warning(f"No suitable video file found for {meeting_topic}")
         logger.warning(f"  Recording types present: {available_types}")
-        should_notify = tracker.record_error(zoom_uuid, "No suitable video file found")
-        if should_notify:
-            _send_error_notification(zoom_uuid, meeting_topic, "No suitable video file found")
+        _record_failure(tracker, zoom_uuid, meeting_topic, "No suitable video file found")
         return
     
     # Check minimum length requirement
     duration_seconds = zoom_client.get_recording_duration_seconds(recording, best_video)
     if config.MIN_VIDEO_LENGTH_SECONDS > 0 and duration_seconds < config.MIN_VIDEO_LENGTH_SECONDS:
         logger.info(f"Video too short ({duration_seconds}s < {config.MIN_VIDEO_LENGTH_SECONDS}s), skipping")
-        should_notify = tracker.record_error(zoom_uuid, f"Video too short: {duration_seconds}s")
-        if should_notify:
-            _send_error_notification(zoom_uuid, meeting_topic, f"Video too short: {duration_seconds}s")
+        _record_failure(tracker, zoom_uuid, meeting_topic, f"Video too short: {duration_seconds}s")
         return
     
     # Generate folder name and file path
     folder_name = zoom_client.generate_folder_name(recording)
     video_type = best_video.get('recording_type', 'video')
     filename = f"{video_type}.mp4"
-    file_path = config.DOWNLOAD_DIR / folder_name / filename
     
-    # Step 1: Download (if not already downloaded)
-    if not existing_record or not existing_record.get('zoom_downloaded_at'):
-        if dry_run:
-            logger.info(f"[DRY RUN] Would download to: {file_path}")
-        else:
-            try:
-                download_url = best_video.get('download_url')
-                if not download_url:
-                    raise ValueError("No download URL in video file")
-                
-                access_token = zoom_client.get_access_token()
-                zoom_client.download_video(download_url, access_token, file_path)
-                had_failures = tracker.record_download(zoom_uuid, meeting_topic, start_time, file_path)
-                logger.info(f"Downloaded: {file_path}")
-                if had_failures:
-                    _send_success_notification(zoom_uuid, meeting_topic, "Download")
-            except Exception as e:
-                logger.error(f"Download failed: {e}")
-                should_notify = tracker.record_error(zoom_uuid, f"Download failed: {e}")
-                if should_notify:
-                    _send_error_notification(zoom_uuid, meeting_topic, f"Download failed: {e}")
-                return
-    else:
-        logger.info(f"Already downloaded: {file_path}")
-        # Verify file still exists
-        if not file_path.exists():
-            logger.warning(f"File missing, will retry download: {file_path}")
-            try:
-                download_url = best_video.get('download_url')
-                if download_url:
-                    access_token = zoom_client.get_access_token()
-                    zoom_client.download_video(download_url, access_token, file_path)
-                    had_failures = tracker.record_download(zoom_uuid, meeting_topic, start_time, file_path)
-                    if had_failures:
-                        _send_success_notification(zoom_uuid, meeting_topic, "Download (retry)")
-            except Exception as e:
-                logger.error(f"Retry download failed: {e}")
-                should_notify = tracker.record_error(zoom_uuid, f"Retry download failed: {e}")
-                if should_notify:
-                    _send_error_notification(zoom_uuid, meeting_topic, f"Retry download failed: {e}")
-                return
+    job = {
+        'tracker': tracker,
+        'dry_run': dry_run,
+        'zoom_uuid': zoom_uuid,
+        'meeting_topic': meeting_topic,
+        'start_time': start_time,
+        'download_url': best_video.get('download_url'),
+        'folder_name': folder_name,
+        'file_path': config.DOWNLOAD_DIR / folder_name / filename,
+        'existing_record': existing_record,
+        # Set by the upload stage, or carried over from an earlier run's upload
+        'youtube_url': existing_record.get('youtube_url', '') if existing_record else '',
+    }
     
-    # Step 2: Upload to YouTube (if not already uploaded)
-    if not existing_record or not existing_record.get('youtube_uploaded_at'):
-        if dry_run:
-            logger.info(f"[DRY RUN] Would upload to YouTube: {file_path}")
-        else:
-            try:
-                if not file_path.exists():
-                    raise FileNotFoundError(f"Video file not found: {file_path}")
-                
-                # Use folder name as title (includes date/time/topic format)
-                title = folder_name
-                youtube_url = youtube_client.upload_video(
-                    video_path=file_path,
-                    title=title,
-                    description=config.YOUTUBE_DEFAULT_DESCRIPTION,
-                    tags=[t.strip() for t in config.YOUTUBE_DEFAULT_TAGS.split(",") if t.strip()],
-                    category_id=config.YOUTUBE_CATEGORY_ID
-                )
-                had_failures = tracker.record_upload(zoom_uuid, youtube_url)
-                logger.info(f"Uploaded to YouTube: {youtube_url}")
-                if had_failures:
-                    _send_success_notification(zoom_uuid, meeting_topic, "Upload")
-            except Exception as e:
-                logger.error(f"Upload failed: {e}")
-                should_notify = tracker.record_error(zoom_uuid, f"Upload failed: {e}")
-                if should_notify:
-                    _send_error_notification(zoom_uuid, meeting_topic, f"Upload failed: {e}")
-                return
-    else:
-        logger.info(f"Already uploaded: {existing_record.get('youtube_url')}")
+    # Run each stage unless the tracker already has its timestamp;
+    # a stage returning False stops processing of this recording
+    for done_field, run_stage, skip_stage in RECORDING_STAGES:
+        stage = skip_stage if existing_record and existing_record.get(done_field) else run_stage
+        if not stage(job):
+            return
+
+
+def _download_stage(job: dict) -> bool:
+    """Download the video file. Returns False if the download failed."""
+    file_path = job['file_path']
+    if job['dry_run']:
+        logger.info(f"[DRY RUN] Would download to: {file_path}")
+        return True
     
-    # Step 3: Send Discord notification (if not already notified)
-    existing_record = tracker.get_record(zoom_uuid)  # Refresh record
-    youtube_url = existing_record.get('youtube_url', '') if existing_record else ''
+    try:
+        if not job['download_url']:
+            raise ValueError("No download URL in video file")
+        
+        # Ask for the token per download: it is cached, and refreshed once it
+        # nears expiry, so downloads late in a long run don't use a stale one
+        zoom_client.download_video(job['download_url'], zoom_client.get_access_token(), file_path)
+        had_failures = job['tracker'].record_download(
+            job['zoom_uuid'], job['meeting_topic'], job['start_time'], file_path
+        )
+        logger.info(f"Downloaded: {file_path}")
+        if had_failures:
+            _send_success_notification(job['zoom_uuid'], job['meeting_topic'], "Download")
+    except Exception as e:
+        logger.error(f"Download failed: {e}")
+        _record_failure(job['tracker'], job['zoom_uuid'], job['meeting_topic'], f"Download failed: {e}")
+        return False
+    return True
+
+
+def _verify_download_stage(job: dict) -> bool:
+    """Re-download an already recorded file that is missing on disk. Returns False on failure."""
+    file_path = job['file_path']
+    logger.info(f"Already downloaded: {file_path}")
+    # Verify file still exists
+    if file_path.exists():
+        return True
     
-    if not existing_record or not existing_record.get('discord_notified_at'):
-        if not youtube_url:
-            logger.warning("Cannot send Discord notification: no YouTube URL")
-            return
+    logger.warning(f"File missing, will retry download: {file_path}")
+    try:
+        if job['download_url']:
+            zoom_client.download_video(job['download_url'], zoom_client.get_access_token(), file_path)
+            had_failures = job['tracker'].record_download(
+                job['zoom_uuid'], job['meeting_topic'], job['start_time'], file_path
+            )
+            if had_failures:
+                _send_success_notification(job['zoom_uuid'], job['meeting_topic'], "Download (retry)")
+    except Exception as e:
+        logger.error(f"Retry download failed: {e}")
+        _record_failure(job['tracker'], job['zoom_uuid'], job['meeting_topic'], f"Retry download failed: {e}")
+        return False
+    return True
+
+
+def _upload_stage(job: dict) -> bool:
+    """Upload the downloaded file to YouTube. Returns False if the upload failed."""
+    file_path = job['file_path']
+    if job['dry_run']:
+        logger.info(f"[DRY RUN] Would upload to YouTube: {file_path}")
+        return True
+    
+    try:
+        if not file_path.exists():
+            raise FileNotFoundError(f"Video file not found: {file_path}")
+        
+        # Imported on first upload: pulls in the Google API client SDK
+        import youtube_client
         
-        if dry_run:
-            logger.info(f"[DRY RUN] Would send Discord notification: {youtube_url}")
+        # Use folder name as title (includes date/time/topic format)
+        title = job['folder_name']
+        youtube_url = youtube_client.upload_video(
+            video_path=file_path,
+            title=title,
+            description=config.YOUTUBE_DEFAULT_DESCRIPTION,
+            tags=config.YOUTUBE_DEFAULT_TAGS_LIST,
+            category_id=config.YOUTUBE_CATEGORY_ID
+        )
+        had_failures = job['tracker'].record_upload(job['zoom_uuid'], youtube_url)
+        job['youtube_url'] = youtube_url
+        logger.info(f"Uploaded to YouTube: {youtube_url}")
+        if had_failures:
+            _send_success_notification(job['zoom_uuid'], job['meeting_topic'], "Upload")
+    except Exception as e:
+        logger.error(f"Upload failed: {e}")
+        _record_failure(job['tracker'], job['zoom_uuid'], job['meeting_topic'], f"Upload failed: {e}")
+        return False
+    return True
+
+
+def _uploaded_stage(job: dict) -> bool:
+    """Report an upload that was already done on an earlier run."""
+    logger.info(f"Already uploaded: {job['youtube_url']}")
+    return True
+
+
+def _notify_stage(job: dict) -> bool:
+    """Send the Discord notification for the uploaded video. Returns False if it was not sent."""
+    tracker = job['tracker']
+    youtube_url = job['youtube_url']
+    if not youtube_url:
+        logger.warning("Cannot send Discord notification: no YouTube URL")
+        return False
+    
+    if job['dry_run']:
+        logger.info(f"[DRY RUN] Would send Discord notification: {youtube_url}")
+        return True
+    
+    try:
+        success = discord_client.send_notification(youtube_url)
+        if success:
+            had_failures = tracker.record_notification(job['zoom_uuid'])
+            logger.info(f"Discord notification sent: {youtube_url}")
+            if had_failures:
+                _send_success_notification(job['zoom_uuid'], job['meeting_topic'], "Discord notification")
         else:
-            try:
-                success = discord_client.send_notification(youtube_url)
-                if success:
-                    had_failures = tracker.record_notification(zoom_uuid)
-                    logger.info(f"Discord notification sent: {youtube_url}")
-                    if had_failures:
-                        _send_success_notification(zoom_uuid, meeting_topic, "Discord notification")
-                else:
-                    should_notify = tracker.record_error(zoom_uuid, "Discord notification failed")
-                    if should_notify:
-                        _send_error_notification(zoom_uuid, meeting_topic, "Discord notification failed")
-            except Exception as e:
-                logger.error(f"Discord notification failed: {e}")
-                should_notify = tracker.record_error(zoom_uuid, f"Discord notification failed: {e}")
-                if should_notify:
-                    _send_error_notification(zoom_uuid, meeting_topic, f"Discord notification failed: {e}")
-    else:
-        logger.info(f"Already notified Discord: {youtube_url}")
+            _record_failure(tracker, job['zoom_uuid'], job['meeting_topic'], "Discord notification failed")
+            return False
+    except Exception as e:
+        logger.error(f"Discord notification failed: {e}")
+        _record_failure(tracker, job['zoom_uuid'], job['meeting_topic'], f"Discord notification failed: {e}")
+        return False
+    return True
+
+
+def _notified_stage(job: dict) -> bool:
+    """Report a Discord notification that was already sent on an earlier run."""
+    logger.info(f"Already notified Discord: {job['youtube_url']}")
+    return True
+
+
+# Pipeline stages in order: (tracker field set when done, run stage, stage when already done)
+RECORDING_STAGES = (
+    ('zoom_downloaded_at', _download_stage, _verify_download_stage),
+    ('youtube_uploaded_at', _upload_stage, _uploaded_stage),
+    ('discord_notified_at', _notify_stage, _notified_stage),
+)
+
+
+def _process_recording_safely(
+    recording: dict,
+    tracker: VideoTracker,
+    dry_run: bool,
+    position: str
+) -> None:
+    """Run process_recording on a worker thread, recording any unexpected error."""
+    logger.info(f"\n[{position}] Processing recording...")
+    try:
+        process_recording(recording, tracker, dry_run=dry_run)
+    except Exception as e:
+        logger.error(f"Error processing recording: {e}", exc_info=True)
+        zoom_uuid = recording.get('uuid', '')
+        meeting_topic = recording.get('topic', 'Unknown Meeting')
+        if zoom_uuid:
+            _record_failure(tracker, zoom_uuid, meeting_topic, f"Processing error: {e}")
 
 
 def retry_failed_recordings(tracker: VideoTracker, dry_run: bool = False) -> None:
@@ -230,19 +316,12 @@ def retry_failed_recordings(tracker: VideoTracker, dry_run: bool = False) -> Non
     
     logger.info(f"Found {len(retry_records)} recording(s) to retry")
     
-    # We need to fetch recordings from Zoom to get full details
-    # For now, we'll skip retries that require re-downloading
-    # and only retry uploads/notifications
-    access_token = None
-    if not dry_run:
-        try:
-            access_token = zoom_client.get_access_token()
-        except Exception as e:
-            logger.error(f"Failed to get Zoom access token for retries: {e}")
-            return
+    # Retries only cover uploads/notifications of already-downloaded files,
+    # so no Zoom access token is needed here; re-downloads happen in process_recording
     
     for record in retry_records:
         uuid = record['zoom_uuid']
+        meeting_topic = record.get('meeting_topic', 'Unknown Meeting')
         file_path_str = record.get('file_path', '')
         
         # Retry upload if downloaded but not uploaded
@@ -255,6 +334,8 @@ def retry_failed_recordings(tracker: VideoTracker, dry_run: bool = False) -> Non
                         logger.info(f"[DRY RUN] Would retry upload: {file_path}")
                     else:
                         try:
+                            import youtube_client
+                            
                             # Extract folder name from file path for title
                             # Path format: downloaded_videos/{folder_name}/{filename}
                             folder_name = file_path.parent.name
@@ -263,20 +344,16 @@ def retry_failed_recordings(tracker: VideoTracker, dry_run: bool = False) -> Non
                                 video_path=file_path,
                                 title=title,
                                 description=config.YOUTUBE_DEFAULT_DESCRIPTION,
-                                tags=[t.strip() for t in config.YOUTUBE_DEFAULT_TAGS.split(",") if t.strip()],
+                                tags=config.YOUTUBE_DEFAULT_TAGS_LIST,
                                 category_id=config.YOUTUBE_CATEGORY_ID
                             )
-                            meeting_topic = record.get('meeting_topic', 'Unknown Meeting')
                             had_failures = tracker.record_upload(uuid, youtube_url)
                             logger.info(f"Retry upload successful: {youtube_url}")
                             if had_failures:
                                 _send_success_notification(uuid, meeting_topic, "Upload (retry)")
                         except Exception as e:
                             logger.error(f"Retry upload failed: {e}")
-                            meeting_topic = record.get('meeting_topic', 'Unknown Meeting')
-                            should_notify = tracker.record_error(uuid, f"Retry upload failed: {e}")
-                            if should_notify:
-                                _send_error_notification(uuid, meeting_topic, f"Retry upload failed: {e}")
+                            _record_failure(tracker, uuid, meeting_topic, f"Retry upload failed: {e}")
         
         # Retry Discord notification if uploaded but not notified
         if record.get('youtube_uploaded_at') and not record.get('discord_notified_at'):
@@ -289,22 +366,15 @@ def retry_failed_recordings(tracker: VideoTracker, dry_run: bool = False) -> Non
                     try:
                         success = discord_client.send_notification(youtube_url)
                         if success:
-                            meeting_topic = record.get('meeting_topic', 'Unknown Meeting')
                             had_failures = tracker.record_notification(uuid)
                             logger.info(f"Retry notification successful")
                             if had_failures:
                                 _send_success_notification(uuid, meeting_topic, "Discord notification (retry)")
                         else:
-                            meeting_topic = record.get('meeting_topic', 'Unknown Meeting')
-                            should_notify = tracker.record_error(uuid, "Retry Discord notification failed")
-                            if should_notify:
-                                _send_error_notification(uuid, meeting_topic, "Retry Discord notification failed")
+                            _record_failure(tracker, uuid, meeting_topic, "Retry Discord notification failed")
                     except Exception as e:
                         logger.error(f"Retry notification failed: {e}")
-                        meeting_topic = record.get('meeting_topic', 'Unknown Meeting')
-                        should_notify = tracker.record_error(uuid, f"Retry notification failed: {e}")
-                        if should_notify:
-                            _send_error_notification(uuid, meeting_topic, f"Retry notification failed: {e}")
+                        _record_failure(tracker, uuid, meeting_topic, f"Retry notification failed: {e}")
 
 
 def main() -> None:
@@ -336,6 +406,7 @@ def main() -> None:
     logger.info(f"  Last meetings to process: {config.LAST_MEETINGS_TO_PROCESS}")
     logger.info(f"  Minimum video length: {config.MIN_VIDEO_LENGTH_SECONDS}s")
     logger.info(f"  Video retention: {config.VIDEO_RETENTION_DAYS} days")
+    logger.info(f"  Parallel workers: {config.PARALLEL_WORKERS}")
     logger.info(f"  Download directory: {config.DOWNLOAD_DIR}")
     logger.info("="*60)
     
@@ -350,9 +421,10 @@ def main() -> None:
     try:
         access_token = zoom_client.get_access_token()
         
-        # Calculate date range (last year to today)
-        to_date = datetime.now().strftime("%Y-%m-%d")
-        from_date = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
+        # Calculate date range (configured look-back window to today)
+        today = date.today()
+        to_date = today.isoformat()
+        from_date = (today - timedelta(days=config.RECORDINGS_DATE_RANGE_DAYS)).isoformat()
         
         recordings = zoom_client.list_recordings(
             access_token=access_token,
@@ -363,19 +435,33 @@ def main() -> None:
         
         logger.info(f"Found {len(recordings)} recording(s) to process")
         
-        # Process each recording
-        for idx, recording in enumerate(recordings, 1):
-            logger.info(f"\n[{idx}/{len(recordings)}] Processing recording...")
-            try:
-                process_recording(recording, tracker, dry_run=args.dry_run)
-            except Exception as e:
-                logger.error(f"Error processing recording: {e}", exc_info=True)
-                zoom_uuid = recording.get('uuid', '')
-                meeting_topic = recording.get('topic', 'Unknown Meeting')
-                if zoom_uuid:
-                    should_notify = tracker.record_error(zoom_uuid, f"Processing error: {e}")
-                    if should_notify:
-                        _send_error_notification(zoom_uuid, meeting_topic, f"Processing error: {e}")
+        # Process recordings concurrently: each one is independent network I/O
+        # (Zoom download, YouTube upload, Discord post)
+        with ThreadPoolExecutor(
+            max_workers=config.PARALLEL_WORKERS,
+            thread_name_prefix="recording"
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _process_recording_safely,
+                    recording,
+                    tracker,
+                    args.dry_run,
+                    f"{idx}/{len(recordings)}"
+                ): recording
+                for idx, recording in enumerate(recordings, 1)
+            }
+            for future in as_completed(futures):
+                # _process_recording_safely's own error handling (tracker write,
+                # Discord) can still raise; surface it instead of losing it
+                try:
+                    future.result()
+                except Exception as e:
+                    recording = futures[future]
+                    logger.error(
+                        f"Unhandled error for recording {recording.get('uuid', '')[:8]}...: {e}",
+                        exc_info=True
+                    )
         
     except Exception as e:
         logger.error(f"Failed to fetch recordings: {e}", exc_info=True)
@@ -8,7 +8,7 @@ import logging
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, TextIO
 
 from dotenv import load_dotenv
 from google.auth.transport.requests import Request
@@ -79,13 +79,18 @@ def get_videos(folder: Path) -> list[Path]:
     """
     if not folder.exists() or not folder.is_dir():
         raise FileNotFoundError(f"Folder not found: {folder}")
-    candidates = [
-        p for p in folder.iterdir() if p.is_file() and p.suffix.lower() in VIDEO_EXTENSIONS
-    ]
+    # scandir entries cache their stat results, so filtering and sorting
+    # need no extra stat call per file
+    with os.scandir(folder) as it:
+        candidates = [
+            e for e in it
+            if e.is_file() and os.path.splitext(e.name)[1].lower() in VIDEO_EXTENSIONS
+        ]
     if not candidates:
         raise FileNotFoundError(f"No video files found in {folder}")
     # Sort by modification time, newest first
-    return sorted(candidates, key=lambda p: p.stat().st_mtime, reverse=True)
+    candidates.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    return [Path(e.path) for e in candidates]
 
 
 def upload_video(
@@ -120,16 +125,14 @@ def upload_video(
     return f"https://youtu.be/{video_id}"
 
 
-def save_upload_result(folder: Path, youtube_url: str, log_path: str) -> None:
-    """Save upload result to a text file."""
-    log_file = Path(log_path)
+def save_upload_result(log_file: TextIO, folder: Path, youtube_url: str) -> None:
+    """Save upload result to the open (line-buffered) results file."""
     timestamp = datetime.now().isoformat()
     # Use absolute path for folder to ensure consistency
     folder_abs = str(folder.resolve())
     
-    with log_file.open("a", encoding="utf-8") as f:
-        f.write(f"{timestamp}\t{folder_abs}\t{youtube_url}\n")
-    logging.info("Upload result saved to %s", log_file)
+    log_file.write(f"{timestamp}\t{folder_abs}\t{youtube_url}\n")
+    logging.info("Upload result saved to %s", log_file.name)
 
 
 def main() -> None:
@@ -183,41 +186,43 @@ def main() -> None:
         youtube = build("youtube", "v3", credentials=creds)
 
         uploaded_urls = []
-        for video_path in video_files:
-            logging.info("Processing video: %s", video_path.name)
+        # Results file is opened once for all uploads of this run
+        with Path(args.log_file).open("a", encoding="utf-8", buffering=1) as log_file:
+            for video_path in video_files:
+                logging.info("Processing video: %s", video_path.name)
             
-            # Determine title: use "[folder name] - [file name]" if multiple videos, 
-            # otherwise just use folder name (unless explicitly provided)
-            if args.title:
-                # If title is provided and multiple videos, append filename
-                if video_count > 1:
-                    video_name = video_path.stem
-                    title = f"{args.title} - {video_name}"
+                # Determine title: use "[folder name] - [file name]" if multiple videos, 
+                # otherwise just use folder name (unless explicitly provided)
+                if args.title:
+                    # If title is provided and multiple videos, append filename
+                    if video_count > 1:
+                        video_name = video_path.stem
+                        title = f"{args.title} - {video_name}"
+                    else:
+                        title = args.title
+                elif video_count > 1:
+                    # Multiple videos: use "[folder name] - [file name]"
+                    video_name = video_path.stem  # filename without extension
+                    title = f"{folder.name} - {video_name}"
                 else:
-                    title = args.title
-            elif video_count > 1:
-                # Multiple videos: use "[folder name] - [file name]"
-                video_name = video_path.stem  # filename without extension
-                title = f"{folder.name} - {video_name}"
-            else:
-                # Single video: use folder name
-                title = folder.name
-
-            url = upload_video(
-                youtube,
-                video_path,
-                title=title,
-                description=args.description,
-                tags=tags_list,
-                category_id=args.category,
-                privacy_status="unlisted",
-            )
-            logging.info("Upload complete: %s", url)
-            print(url)
-            uploaded_urls.append(url)
+                    # Single video: use folder name
+                    title = folder.name
+
+                url = upload_video(
+                    youtube,
+                    video_path,
+                    title=title,
+                    description=args.description,
+                    tags=tags_list,
+                    category_id=args.category,
+                    privacy_status="unlisted",
+                )
+                logging.info("Upload complete: %s", url)
+                print(url)
+                uploaded_urls.append(url)
             
-            # Save upload result to log file
-            save_upload_result(folder, url, args.log_file)
+                # Save upload result to log file
+                save_upload_result(log_file, folder, url)
         
         logging.info("All uploads complete. Uploaded %d video(s).", len(uploaded_urls))
     except (HttpError, FileNotFoundError, RuntimeError) as exc:
@@ -44,3 +44,6 @@ DOWNLOAD_DIR = _default_download_dir
 # Set to 0 to download all videos regardless of length
 MIN_VIDEO_LENGTH_SECONDS = int(os.getenv("MIN_VIDEO_LENGTH_SECONDS", "60"))
 
+# Number of video files downloaded concurrently
+PARALLEL_DOWNLOADS = max(1, int(os.getenv("PARALLEL_DOWNLOADS", "4")))
+
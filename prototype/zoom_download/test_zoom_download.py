@@ -1,8 +1,14 @@
 """Simple prototype to test downloading videos from Zoom cloud using OAuth authorization code flow."""
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import base64
 import os
+import shutil
+import threading
+import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 from dotenv import load_dotenv
@@ -21,6 +27,58 @@ ZOOM_USER_ID = os.getenv("ZOOM_USER_ID")
 REFRESH_TOKEN_FILE = ".zoom_refresh_token"
 
 
+# Access tokens are reused until shortly before they expire (Zoom issues them for 1 hour)
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
+_token_cache = {"token": None, "expires_at": 0.0}
+# Download workers share the cache; only one may refresh, since Zoom rotates the refresh token
+_token_lock = threading.Lock()
+
+
+def _cache_access_token(token_data):
+    """Remember an access token from a Zoom token response until just before it expires."""
+    expires_in = int(token_data.get("expires_in", 3600))
+    _token_cache["token"] = token_data.get("access_token")
+    _token_cache["expires_at"] = time.monotonic() + expires_in - TOKEN_EXPIRY_MARGIN_SECONDS
+
+
+class TokenExpiredError(Exception):
+    """The saved Zoom refresh token has expired or been revoked."""
+
+
+# Shared session so token, list and download calls reuse keep-alive TLS
+# connections. The pool holds one connection per parallel download. Status
+# retries only apply to idempotent requests (the urllib3 default); token POSTs
+# use the stricter adapter below because Zoom rotates the refresh token.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=config.PARALLEL_DOWNLOADS,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    ),
+))
+
+# Token POSTs get their own adapter (requests picks the longest matching
+# prefix). They are retried only when Zoom cannot have used the refresh token:
+# connection failures before the request is sent, and 429/503 responses.
+# Read errors are never retried, since Zoom may already have rotated the token.
+_session.mount("https://zoom.us/oauth/", HTTPAdapter(
+    max_retries=Retry(
+        total=3,
+        connect=3,
+        read=0,
+        status=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 503],
+        allowed_methods=["POST"],
+        raise_on_status=False,
+    ),
+))
+
+
 def get_authorization_url():
     """Generate the authorization URL for user to visit."""
     params = {
@@ -50,12 +108,13 @@ def exchange_code_for_tokens(authorization_code):
         "redirect_uri": ZOOM_REDIRECT_URI
     }
     
-    response = requests.post("https://zoom.us/oauth/token", headers=headers, data=data)
+    response = _session.post("https://zoom.us/oauth/token", headers=headers, data=data)
     response.raise_for_status()
     
     token_data = response.json()
     access_token = token_data.get("access_token")
     refresh_token = token_data.get("refresh_token")
+    _cache_access_token(token_data)
     
     # Save refresh token for future use
     if refresh_token:
@@ -81,12 +140,22 @@ def get_access_token_from_refresh(refresh_token):
         "refresh_token": refresh_token
     }
     
-    response = requests.post("https://zoom.us/oauth/token", headers=headers, data=data)
+    response = _session.post("https://zoom.us/oauth/token", headers=headers, data=data)
+    
+    # Only an invalid_grant answer means the refresh token itself is dead
+    if response.status_code != 200:
+        try:
+            error_code = response.json().get("error", "")
+        except (ValueError, AttributeError):
+            error_code = ""
+        if error_code == "invalid_grant":
+            raise TokenExpiredError(f"Refresh token expired or revoked: {response.text[:500]}")
     response.raise_for_status()
     
     token_data = response.json()
     access_token = token_data.get("access_token")
     new_refresh_token = token_data.get("refresh_token")
+    _cache_access_token(token_data)
     
     # Update refresh token if a new one is provided
     if new_refresh_token and new_refresh_token != refresh_token:
@@ -96,8 +165,30 @@ def get_access_token_from_refresh(refresh_token):
     return access_token
 
 
+def _get_cached_access_token():
+    """Return the cached access token if it is still valid, None otherwise."""
+    cached_token = _token_cache["token"]
+    if cached_token and time.monotonic() < _token_cache["expires_at"]:
+        return cached_token
+    return None
+
+
 def get_zoom_access_token():
     """Get OAuth access token using refresh token or guide user through authorization."""
+    cached_token = _get_cached_access_token()
+    if cached_token:
+        return cached_token
+    
+    with _token_lock:
+        # Another worker may have refreshed while this one waited for the lock
+        cached_token = _get_cached_access_token()
+        if cached_token:
+            return cached_token
+        return _get_zoom_access_token()
+
+
+def _get_zoom_access_token():
+    """Refresh the access token or run the interactive authorization flow."""
     print("Getting Zoom access token...")
     
     # Check if we have a saved refresh token
@@ -110,10 +201,12 @@ def get_zoom_access_token():
             access_token = get_access_token_from_refresh(refresh_token)
             print("✓ Access token obtained from refresh token")
             return access_token
-        except Exception as e:
+        except TokenExpiredError as e:
             print(f"  Refresh token expired or invalid: {e}")
             print("  Need to re-authorize...")
             os.remove(REFRESH_TOKEN_FILE)
+        # Any other failure (network error, Zoom outage) propagates and keeps
+        # the refresh token on disk for the next attempt
     
     # No valid refresh token, need to get authorization code
     print("\n" + "="*60)
@@ -155,7 +248,7 @@ def list_recordings(access_token, page_size=30, from_date=None, to_date=None):
     if to_date:
         params["to"] = to_date
     
-    response = requests.get(url, headers=headers, params=params)
+    response = _session.get(url, headers=headers, params=params)
     
     if response.status_code != 200:
         print(f"  Error: {response.status_code}")
@@ -200,7 +293,7 @@ def list_recordings(access_token, page_size=30, from_date=None, to_date=None):
         if to_date:
             next_params["to"] = to_date
             
-        response = requests.get(url, headers=headers, params=next_params)
+        response = _session.get(url, headers=headers, params=next_params)
         response.raise_for_status()
         
         page_data = response.json()
@@ -217,17 +310,28 @@ def list_recordings(access_token, page_size=30, from_date=None, to_date=None):
     return all_recordings
 
 
+# Characters not allowed in filenames, each replaced by '_' in one translate pass
+_SANITIZE_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+
 def sanitize_filename(name):
     """Sanitize a string to be safe for use as a filename."""
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        name = name.replace(char, '_')
-    name = name.strip(' .')
+    name = name.translate(_SANITIZE_TABLE).strip(' .')
     if len(name) > 200:
         name = name[:200]
     return name
 
 
+# Recording file types that are not videos (audio, transcripts, chat, etc.)
+NON_VIDEO_RECORDING_TYPES = frozenset({
+    'audio_only',
+    'timeline',
+    'audio_transcript',
+    'chat_file',
+    'closed_caption',
+})
+
+
 def is_video_file(recording_file):
     """
     Check if a recording file is a video file (not audio, transcript, etc.).
@@ -239,17 +343,7 @@ def is_video_file(recording_file):
         Boolean indicating if this is a video file
     """
     recording_type = recording_file.get("recording_type", "").lower()
-    
-    # Skip non-video files
-    skip_types = [
-        'audio_only',
-        'timeline',
-        'audio_transcript',
-        'chat_file',
-        'closed_caption'
-    ]
-    
-    return recording_type not in skip_types
+    return recording_type not in NON_VIDEO_RECORDING_TYPES
 
 
 def get_all_video_files(recording_files):
@@ -277,19 +371,46 @@ def download_video(download_url, access_token, output_path):
         "Authorization": f"Bearer {access_token}"
     }
     
-    response = requests.get(download_url, headers=headers, stream=True, timeout=300)
+    response = _session.get(download_url, headers=headers, stream=True, timeout=300)
     response.raise_for_status()
     
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
+    # Copy the raw stream in 1 MiB blocks; decode_content keeps any Content-Encoding handled
+    response.raw.decode_content = True
     with open(output_path, 'wb') as f:
-        for chunk in response.iter_content(chunk_size=8192):
-            f.write(chunk)
+        shutil.copyfileobj(response.raw, f, length=1024 * 1024)
     
     file_size = os.path.getsize(output_path)
     print(f"✓ Downloaded {file_size / (1024*1024):.2f} MB")
 
 
+def download_queued_video(download_url, output_path):
+    """Download a queued video file, fetching the access token when the job starts."""
+    # Jobs late in a long batch may start after the first token has expired;
+    # get_zoom_access_token() returns the cached one until it nears expiry
+    download_video(download_url, get_zoom_access_token(), output_path)
+
+
+def is_download_complete(output_path, expected_size):
+    """
+    Check if a video file was fully downloaded.
+    
+    Args:
+        output_path: Path of the downloaded file
+        expected_size: file_size reported by the Zoom API (0 if unknown)
+    
+    Returns:
+        Boolean indicating if the file exists and matches the expected size
+    """
+    try:
+        actual_size = os.path.getsize(output_path)
+    except OSError:
+        return False
+    # Without a reported size, existence is the best available check
+    return not expected_size or actual_size == expected_size
+
+
 def generate_folder_name(recording, template=None):
     """
     Generate folder name for a recording based on template.
@@ -371,6 +492,7 @@ def main():
     
     total_downloaded = 0
     skipped_recordings = []
+    download_jobs = []
     
     for idx, recording in enumerate(recordings_to_process, 1):
         meeting_topic = recording.get('topic', 'Untitled Meeting')
@@ -481,8 +603,8 @@ def main():
         recording_dir = os.path.join(config.DOWNLOAD_DIR, folder_name)
         os.makedirs(recording_dir, exist_ok=True)
         
-        # Download all video files
-        recording_downloaded = 0
+        # Queue all video files; they are downloaded together after the scan
+        recording_queued = 0
         for video_file in video_files:
             file_type = video_file.get('recording_type', 'unknown')
             download_url = video_file.get('download_url')
@@ -495,21 +617,36 @@ def main():
             filename = f"{file_type}.mp4"
             output_path = f"{recording_dir}/{filename}"
             
-            # Skip if already downloaded
-            if os.path.exists(output_path):
+            # Skip if already downloaded; a partial file from an interrupted run is downloaded again
+            if is_download_complete(output_path, file_size):
                 print(f"    ⊙ Skipping {file_type}: Already exists")
                 continue
+            if os.path.exists(output_path):
+                print(f"    ↻ Re-downloading {file_type}: existing file is incomplete")
             
-            try:
-                print(f"    ↓ Downloading {file_type} ({file_size / (1024*1024):.1f} MB)...")
-                download_video(download_url, access_token, output_path)
-                print(f"    ✓ Downloaded {file_type}")
-                recording_downloaded += 1
-                total_downloaded += 1
-            except Exception as e:
-                print(f"    ✗ Failed to download {file_type}: {e}")
+            print(f"    + Queued {file_type} ({file_size / (1024*1024):.1f} MB)")
+            download_jobs.append((meeting_topic, file_type, download_url, output_path))
+            recording_queued += 1
         
-        print(f"  ✓ Recording complete: {recording_downloaded}/{len(video_files)} files downloaded")
+        print(f"  ✓ Recording scanned: {recording_queued}/{len(video_files)} files queued for download")
+    
+    # Downloads are network-bound, so running several at once uses the bandwidth
+    # a single stream leaves idle; one failed file does not stop the others
+    if download_jobs:
+        print(f"\nDownloading {len(download_jobs)} file(s), {config.PARALLEL_DOWNLOADS} at a time...")
+        with ThreadPoolExecutor(max_workers=config.PARALLEL_DOWNLOADS) as executor:
+            futures = {
+                executor.submit(download_queued_video, download_url, output_path): (meeting_topic, file_type)
+                for meeting_topic, file_type, download_url, output_path in download_jobs
+            }
+            for future in as_completed(futures):
+                meeting_topic, file_type = futures[future]
+                try:
+                    future.result()
+                    print(f"    ✓ Downloaded {meeting_topic}: {file_type}")
+                    total_downloaded += 1
+                except Exception as e:
+                    print(f"    ✗ Failed to download {meeting_topic}: {file_type}: {e}")
     
     print(f"\n{'='*60}")
     print(f"Download Summary")
@@ -0,0 +1,17 @@
+"""Shared test setup: provide the environment config.py requires at import."""
+import os
+import sys
+from pathlib import Path
+
+_REQUIRED_ENV = {
+    "ZOOM_CLIENT_ID": "test-zoom-client-id",
+    "ZOOM_CLIENT_SECRET": "test-zoom-client-secret",
+    "ZOOM_USER_ID": "user@example.com",
+    "YOUTUBE_CLIENT_ID": "test-youtube-client-id",
+    "YOUTUBE_CLIENT_SECRET": "test-youtube-client-secret",
+    "DISCORD_WEBHOOK_URL": "https://discord.invalid/webhook",
+}
+for name, value in _REQUIRED_ENV.items():
+    os.environ.setdefault(name, value)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,45 @@
+"""Tests for the YouTube OAuth flow's state validation."""
+from unittest import mock
+
+import pytest
+
+import config
+import youtube_client
+
+
+@pytest.fixture
+def oauth_flow(tmp_path, monkeypatch):
+    """Run _get_credentials's interactive flow with a known state and no network."""
+    monkeypatch.setattr(config, "YOUTUBE_TOKEN_FILE", tmp_path / "youtube_token.json")
+    monkeypatch.setattr(youtube_client.secrets, "token_urlsafe", lambda nbytes: "expected-state")
+    token_response = mock.Mock()
+    token_response.json.return_value = {"access_token": "at", "refresh_token": "rt", "expires_in": 3600}
+    with mock.patch.object(youtube_client._session, "post", return_value=token_response) as post_mock:
+        yield post_mock
+
+
+def test_mismatched_redirect_state_is_rejected_before_token_exchange(oauth_flow):
+    with mock.patch.object(youtube_client, "start_google_oauth_server", return_value=("code", "forged-state")):
+        with pytest.raises(youtube_client.OAuthStateError):
+            youtube_client._get_credentials()
+    
+    oauth_flow.assert_not_called()
+
+
+def test_mismatched_pasted_url_state_is_rejected_before_token_exchange(oauth_flow, monkeypatch):
+    monkeypatch.setattr("builtins.input", lambda prompt: "http://127.0.0.1:8082/?code=code&state=forged-state")
+    with mock.patch.object(youtube_client, "start_google_oauth_server", return_value=(None, None)):
+        with pytest.raises(youtube_client.OAuthStateError):
+            youtube_client._get_credentials()
+    
+    oauth_flow.assert_not_called()
+
+
+def test_matching_state_exchanges_code(oauth_flow):
+    with mock.patch.object(youtube_client, "start_google_oauth_server", return_value=("code", "expected-state")):
+        creds = youtube_client._get_credentials()
+    
+    assert oauth_flow.call_count == 1
+    assert oauth_flow.call_args.kwargs["data"]["code"] == "code"
+    assert creds.token == "at"
+    assert config.YOUTUBE_TOKEN_FILE.exists()
@@ -0,0 +1,65 @@
+"""Tests for zoom_client's handling of rejected access tokens."""
+import io
+from unittest import mock
+
+import pytest
+
+import zoom_client
+
+
+def _response(status_code, json_data=None, body=b""):
+    response = mock.Mock(status_code=status_code, raw=io.BytesIO(body), content=body)
+    response.json.return_value = json_data
+    if status_code >= 400:
+        response.raise_for_status.side_effect = zoom_client.requests.HTTPError(str(status_code))
+    return response
+
+
+@pytest.fixture
+def token_cache():
+    """Seed the cache with a token Zoom will reject; refreshing yields a new one."""
+    zoom_client._cache_access_token({"access_token": "stale", "expires_in": 3600})
+    def refresh():
+        zoom_client._cache_access_token({"access_token": "fresh", "expires_in": 3600})
+        return "fresh"
+    with mock.patch.object(zoom_client, "_get_access_token", side_effect=refresh) as refresh_mock:
+        yield refresh_mock
+    zoom_client.invalidate_access_token()
+
+
+def _auth_headers(get_mock):
+    return [call.kwargs["headers"]["Authorization"] for call in get_mock.call_args_list]
+
+
+def test_download_video_retries_once_with_fresh_token_on_401(tmp_path, token_cache):
+    responses = [_response(401), _response(200, body=b"video-bytes")]
+    output_path = tmp_path / "meeting" / "gallery_view.mp4"
+    
+    with mock.patch.object(zoom_client._session, "get", side_effect=responses) as get_mock:
+        zoom_client.download_video("https://zoom.us/rec/download/1", "stale", output_path)
+    
+    assert _auth_headers(get_mock) == ["Bearer stale", "Bearer fresh"]
+    assert token_cache.call_count == 1
+    assert output_path.read_bytes() == b"video-bytes"
+
+
+def test_download_video_gives_up_after_second_401(tmp_path, token_cache):
+    responses = [_response(401), _response(401)]
+    
+    with mock.patch.object(zoom_client._session, "get", side_effect=responses) as get_mock:
+        with pytest.raises(zoom_client.requests.HTTPError):
+            zoom_client.download_video("https://zoom.us/rec/download/1", "stale", tmp_path / "v.mp4")
+    
+    assert get_mock.call_count == 2
+
+
+def test_iter_recordings_retries_once_with_fresh_token_on_401(token_cache):
+    page = {"meetings": [{"uuid": "a"}, {"uuid": "b"}], "next_page_token": ""}
+    responses = [_response(401), _response(200, json_data=page)]
+    
+    with mock.patch.object(zoom_client._session, "get", side_effect=responses) as get_mock:
+        recordings = list(zoom_client.iter_recordings("stale"))
+    
+    assert [r["uuid"] for r in recordings] == ["a", "b"]
+    assert _auth_headers(get_mock) == ["Bearer stale", "Bearer fresh"]
+    assert token_cache.call_count == 1
@@ -43,22 +43,22 @@ def cleanup_old_videos(retention_days: int = None) -> int:
                 file_path_str = record.get('file_path', '')
                 if file_path_str:
                     file_path = Path(file_path_str)
-                    if file_path.exists():
+                    try:
+                        file_path.unlink()
+                        logger.info(f"Deleted old video: {file_path}")
+                        deleted_count += 1
+                        
+                        # Try to remove parent directory if empty (rmdir refuses non-empty ones)
+                        parent_dir = file_path.parent
                         try:
-                            file_path.unlink()
-                            logger.info(f"Deleted old video: {file_path}")
-                            deleted_count += 1
-                            
-                            # Try to remove parent directory if empty
-                            parent_dir = file_path.parent
-                            try:
-                                if parent_dir.exists() and not any(parent_dir.iterdir()):
-                                    parent_dir.rmdir()
-                                    logger.debug(f"Removed empty directory: {parent_dir}")
-                            except OSError:
-                                pass  # Directory not empty or other error
-                        except Exception as e:
-                            logger.error(f"Failed to delete {file_path}: {e}")
+                            parent_dir.rmdir()
+                            logger.debug(f"Removed empty directory: {parent_dir}")
+                        except OSError:
+                            pass  # Directory not empty or other error
+                    except FileNotFoundError:
+                        pass  # Already deleted on an earlier run
+                    except Exception as e:
+                        logger.error(f"Failed to delete {file_path}: {e}")
         except (ValueError, TypeError) as e:
             logger.warning(f"Invalid date format in record {record.get('zoom_uuid')}: {e}")
             continue
@@ -1,6 +1,9 @@
 """CSV-based tracking database for processed recordings."""
 import csv
+import functools
 import logging
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -25,13 +28,35 @@ CSV_HEADERS = [
     "last_notified_error"
 ]
 
+# Template for new rows: every column present and empty
+_EMPTY_ROW = {header: '' for header in CSV_HEADERS}
+
+
+def _locked(method):
+    """Serialize a tracker method so concurrent workers never interleave record updates."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class VideoTracker:
-    """Manages CSV tracking database for processed recordings."""
+    """
+    Manages CSV tracking database for processed recordings.
+    
+    The CSV is read once when the tracker is created; lookups are served from an
+    in-memory index keyed by zoom_uuid, and every update is written back to the CSV.
+    """
     
     def __init__(self, csv_path: Path = None):
         self.csv_path = csv_path or config.CSV_TRACKER_PATH
+        self._lock = threading.Lock()
         self._ensure_csv_exists()
+        self._records = self._read_all_records()
+        self._by_uuid: dict[str, dict] = {}
+        for record in self._records:
+            self._by_uuid.setdefault(record['zoom_uuid'], record)
     
     def _ensure_csv_exists(self) -> None:
         """Create CSV file with headers if it doesn't exist."""
@@ -61,33 +86,40 @@ class VideoTracker:
         return records
     
     def _write_all_records(self, records: list[dict]) -> None:
-        """Write all records to CSV."""
-        with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
+        """Write all records to CSV (atomically, so a crash never leaves a partial file)."""
+        tmp_path = self.csv_path.with_name(self.csv_path.name + '.tmp')
+        with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
             writer = csv.DictWriter(f, fieldnames=CSV_HEADERS)
             writer.writeheader()
             writer.writerows(records)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.csv_path)
+    
+    def _add_record(self, record: dict) -> None:
+        """Add a new record to the in-memory store."""
+        self._records.append(record)
+        self._by_uuid[record['zoom_uuid']] = record
     
+    @_locked
     def is_processed(self, zoom_uuid: str) -> bool:
         """Check if a recording has been fully processed (downloaded + uploaded + notified)."""
-        records = self._read_all_records()
-        for record in records:
-            if record['zoom_uuid'] == zoom_uuid:
-                # Check if fully processed
-                return bool(
-                    record.get('zoom_downloaded_at') and
-                    record.get('youtube_uploaded_at') and
-                    record.get('discord_notified_at')
-                )
-        return False
+        record = self._by_uuid.get(zoom_uuid)
+        if record is None:
+            return False
+        return bool(
+            record.get('zoom_downloaded_at') and
+            record.get('youtube_uploaded_at') and
+            record.get('discord_notified_at')
+        )
     
+    @_locked
     def get_record(self, zoom_uuid: str) -> Optional[dict]:
-        """Get a record by UUID."""
-        records = self._read_all_records()
-        for record in records:
-            if record['zoom_uuid'] == zoom_uuid:
-                return record
-        return None
+        """Get a copy of a record by UUID."""
+        record = self._by_uuid.get(zoom_uuid)
+        return dict(record) if record is not None else None
     
+    @_locked
     def record_download(
         self,
         zoom_uuid: str,
@@ -101,23 +133,16 @@ class VideoTracker:
         Returns:
             True if there were previous failures that were resolved, False otherwise
         """
-        records = self._read_all_records()
-        
         # Find existing record or create new one
-        record = None
-        for r in records:
-            if r['zoom_uuid'] == zoom_uuid:
-                record = r
-                break
-        
+        record = self._by_uuid.get(zoom_uuid)
         if record is None:
-            record = {header: '' for header in CSV_HEADERS}
+            record = _EMPTY_ROW.copy()
             record['zoom_uuid'] = zoom_uuid
             record['meeting_topic'] = meeting_topic
             record['start_time'] = start_time
             record['failure_count'] = '0'
             record['error_notified_at'] = ''
-            records.append(record)
+            self._add_record(record)
         
         # Check if there were previous failures before clearing
         had_failures = False
@@ -135,11 +160,12 @@ class VideoTracker:
         record['error_notified_at'] = ''  # Clear notification timestamp
         record['last_notified_error'] = ''  # Clear last notified error
         
-        self._write_all_records(records)
+        self._write_all_records(self._records)
         logger.debug(f"Recorded download: {zoom_uuid}")
         
         return had_failures
     
+    @_locked
     def record_upload(self, zoom_uuid: str, youtube_url: str) -> bool:
         """
         Record a successful upload.
@@ -147,32 +173,31 @@ class VideoTracker:
         Returns:
             True if there were previous failures that were resolved, False otherwise
         """
-        records = self._read_all_records()
+        record = self._by_uuid.get(zoom_uuid)
+        if record is None:
+            logger.warning(f"Attempted to record upload for unknown UUID: {zoom_uuid}")
+            return False
         
-        for record in records:
-            if record['zoom_uuid'] == zoom_uuid:
-                # Check if there were previous failures before clearing
-                had_failures = False
-                try:
-                    failure_count = int(record.get('failure_count', '0') or '0')
-                    had_failures = failure_count >= config.ERROR_NOTIFICATION_THRESHOLD
-                except (ValueError, TypeError):
-                    pass
-                
-                record['youtube_uploaded_at'] = datetime.now().isoformat()
-                record['youtube_url'] = youtube_url
-                record['status'] = 'uploaded'
-                record['error_message'] = ''  # Clear any previous errors
-                record['failure_count'] = '0'  # Reset failure count on success
-                record['error_notified_at'] = ''  # Clear notification timestamp
-                record['last_notified_error'] = ''  # Clear last notified error
-                self._write_all_records(records)
-                logger.debug(f"Recorded upload: {zoom_uuid}")
-                return had_failures
+        # Check if there were previous failures before clearing
+        had_failures = False
+        try:
+            failure_count = int(record.get('failure_count', '0') or '0')
+            had_failures = failure_count >= config.ERROR_NOTIFICATION_THRESHOLD
+        except (ValueError, TypeError):
+            pass
         
-        logger.warning(f"Attempted to record upload for unknown UUID: {zoom_uuid}")
-        return False
+        record['youtube_uploaded_at'] = datetime.now().isoformat()
+        record['youtube_url'] = youtube_url
+        record['status'] = 'uploaded'
+        record['error_message'] = ''  # Clear any previous errors
+        record['failure_count'] = '0'  # Reset failure count on success
+        record['error_notified_at'] = ''  # Clear notification timestamp
+        record['last_notified_error'] = ''  # Clear last notified error
+        self._write_all_records(self._records)
+        logger.debug(f"Recorded upload: {zoom_uuid}")
+        return had_failures
     
+    @_locked
     def record_notification(self, zoom_uuid: str) -> bool:
         """
         Record a successful Discord notification.
@@ -180,31 +205,30 @@ class VideoTracker:
         Returns:
             True if there were previous failures that were resolved, False otherwise
         """
-        records = self._read_all_records()
+        record = self._by_uuid.get(zoom_uuid)
+        if record is None:
+            logger.warning(f"Attempted to record notification for unknown UUID: {zoom_uuid}")
+            return False
         
-        for record in records:
-            if record['zoom_uuid'] == zoom_uuid:
-                # Check if there were previous failures before clearing
-                had_failures = False
-                try:
-                    failure_count = int(record.get('failure_count', '0') or '0')
-                    had_failures = failure_count >= config.ERROR_NOTIFICATION_THRESHOLD
-                except (ValueError, TypeError):
-                    pass
-                
-                record['discord_notified_at'] = datetime.now().isoformat()
-                record['status'] = 'notified'
-                record['error_message'] = ''  # Clear any previous errors
-                record['failure_count'] = '0'  # Reset failure count on success
-                record['error_notified_at'] = ''  # Clear notification timestamp
-                record['last_notified_error'] = ''  # Clear last notified error
-                self._write_all_records(records)
-                logger.debug(f"Recorded notification: {zoom_uuid}")
-                return had_failures
+        # Check if there were previous failures before clearing
+        had_failures = False
+        try:
+            failure_count = int(record.get('failure_count', '0') or '0')
+            had_failures = failure_count >= config.ERROR_NOTIFICATION_THRESHOLD
+        except (ValueError, TypeError):
+            pass
         
-        logger.warning(f"Attempted to record notification for unknown UUID: {zoom_uuid}")
-        return False
+        record['discord_notified_at'] = datetime.now().isoformat()
+        record['status'] = 'notified'
+        record['error_message'] = ''  # Clear any previous errors
+        record['failure_count'] = '0'  # Reset failure count on success
+        record['error_notified_at'] = ''  # Clear notification timestamp
+        record['last_notified_error'] = ''  # Clear last notified error
+        self._write_all_records(self._records)
+        logger.debug(f"Recorded notification: {zoom_uuid}")
+        return had_failures
     
+    @_locked
     def record_error(self, zoom_uuid: str, error_message: str, status: str = 'failed') -> bool:
         """
         Record an error and increment failure count.
@@ -212,22 +236,15 @@ class VideoTracker:
         Returns:
             True if notification should be sent (threshold reached), False otherwise
         """
-        records = self._read_all_records()
-        
         # Find existing record or create new one
-        record = None
-        for r in records:
-            if r['zoom_uuid'] == zoom_uuid:
-                record = r
-                break
-        
+        record = self._by_uuid.get(zoom_uuid)
         if record is None:
-            record = {header: '' for header in CSV_HEADERS}
+            record = _EMPTY_ROW.copy()
             record['zoom_uuid'] = zoom_uuid
             record['failure_count'] = '0'
             record['error_notified_at'] = ''
             record['last_notified_error'] = ''
-            records.append(record)
+            self._add_record(record)
         
         # Increment failure count
         try:
@@ -257,17 +274,17 @@ class VideoTracker:
                 record['error_notified_at'] = datetime.now().isoformat()
                 record['last_notified_error'] = str(error_message)
         
-        self._write_all_records(records)
+        self._write_all_records(self._records)
         logger.debug(f"Recorded error: {zoom_uuid} - {error_message} (failure_count: {failure_count})")
         
         return should_notify
     
+    @_locked
     def get_records_for_retry(self) -> list[dict]:
-        """Get records that need retry (failed or incomplete)."""
-        records = self._read_all_records()
+        """Get copies of records that need retry (failed or incomplete)."""
         retry_records = []
         
-        for record in records:
+        for record in self._records:
             uuid = record['zoom_uuid']
             status = record.get('status', '')
             file_path = record.get('file_path', '')
@@ -293,11 +310,12 @@ class VideoTracker:
                     continue
             
             if needs_retry:
-                retry_records.append(record)
+                retry_records.append(dict(record))
         
         return retry_records
     
+    @_locked
     def get_all_records(self) -> list[dict]:
-        """Get all records (for cleanup operations)."""
-        return self._read_all_records()
+        """Get copies of all records (for cleanup operations)."""
+        return [dict(record) for record in self._records]
 
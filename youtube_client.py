@@ -1,21 +1,20 @@
 """YouTube API client for uploading videos."""
+import html
 import logging
-import os
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import List, Optional, Tuple
 from urllib.parse import urlparse, parse_qs, urlencode
 from http.server import HTTPServer, BaseHTTPRequestHandler
-import socket
+import threading
 import time
 import secrets
 
 import requests
+from requests.adapters import HTTPAdapter
 from google.auth.transport.requests import Request
 from google.auth.exceptions import RefreshError
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaFileUpload
 
 import config
 
@@ -32,9 +31,96 @@ except ImportError:
 SCOPES = ["https://www.googleapis.com/auth/youtube.upload"]
 
 
+class OAuthStateError(RuntimeError):
+    """The OAuth redirect's state does not match the one this flow generated."""
+
+
+# Videos below this size are uploaded in one request instead of in chunks
+SINGLE_REQUEST_UPLOAD_MAX_BYTES = 100 * 1024 * 1024
+
+# Minimum progress change (in percent) between upload progress log lines
+UPLOAD_PROGRESS_LOG_STEP_PCT = 5.0
+
+# Shared session for Google OAuth token requests (code exchange and refreshes),
+# so repeated refreshes reuse the keep-alive connection to oauth2.googleapis.com
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+_auth_request = Request(session=_session)
+
+# Uploads may run on several worker threads; only one of them may refresh the
+# token file or run the interactive OAuth flow (which binds a fixed port).
+_credentials_lock = threading.Lock()
+# Credentials are reused in-process until google-auth considers them expired
+_credentials_cache = {"creds": None}
+
+# API service objects are reused across uploads, one per thread because the
+# underlying httplib2 connection is not thread-safe
+_service_local = threading.local()
+
+
+# Redirect page bodies, built once at import
+_OAUTH_SUCCESS_HTML = b"""
+    <html>
+    <head><title>Authorization Successful</title></head>
+    <body>
+        <h1>Authorization Successful!</h1>
+        <p>You can close this window and return to the terminal.</p>
+        <p>The authorization code has been captured automatically.</p>
+    </body>
+    </html>
+"""
+_OAUTH_SUCCESS_LEN = str(len(_OAUTH_SUCCESS_HTML))
+_OAUTH_ERROR_HTML = b"""
+    <html>
+    <head><title>Authorization Failed</title></head>
+    <body>
+        <h1>Authorization Failed</h1>
+        <p>Error: %b</p>
+        <p>Please check the terminal for instructions.</p>
+    </body>
+    </html>
+"""
+
+
+# Setup instructions printed when YouTube authorization is required; filled
+# in with the redirect port and authorization URL
+_OAUTH_INSTRUCTIONS_TEMPLATE = "\n".join([
+    "\n" + "="*60,
+    "YouTube authorization required!",
+    "="*60,
+    "\nOPTION 1: Automatic (Recommended if using SSH port forwarding)",
+    "="*60,
+    "1. If connecting via SSH, set up port forwarding FIRST:",
+    "   ssh -L {port}:localhost:{port} user@remote-host",
+    "   (Run this in a separate terminal before running the script)",
+    "\n2. Visit this URL in your browser:",
+    "\n   {authorization_url}\n",
+    "3. Click 'Continue' on the Google authorization page.",
+    "4. The code will be captured automatically - you'll see a success page.",
+    "\n" + "="*60,
+    "OPTION 2: Manual (If port forwarding is not available)",
+    "="*60,
+    "1. Visit this URL in your browser:",
+    "\n   {authorization_url}\n",
+    "2. Click 'Continue' on the Google authorization page.",
+    "3. IMPORTANT: After clicking 'Continue', Google will redirect you.",
+    "   Even if you see an error page (like 'Connection refused'),",
+    "   LOOK AT YOUR BROWSER'S ADDRESS BAR - it will contain the code!",
+    "\n4. The URL will look like:",
+    "   http://127.0.0.1:{port}/?code=ABC123XYZ...&state=...",
+    "\n5. Copy everything after 'code=' until the next '&' (if any).",
+    "   Example: If URL is '...?code=ABC123&state=...', copy 'ABC123'",
+    "   Or paste the full URL - the script will extract the code automatically.",
+    "\n" + "="*60,
+])
+
+
 class GoogleOAuthRedirectHandler(BaseHTTPRequestHandler):
     """HTTP request handler to capture Google OAuth redirect."""
     
+    # Set TCP_NODELAY on the accepted connection so the small reply isn't held back
+    disable_nagle_algorithm = True
+    
     def do_GET(self):
         """Handle GET request from OAuth redirect."""
         parsed_path = urlparse(self.path)
@@ -49,33 +135,18 @@ class GoogleOAuthRedirectHandler(BaseHTTPRequestHandler):
             # Send success response
             self.send_response(200)
             self.send_header('Content-type', 'text/html')
+            self.send_header('Content-Length', _OAUTH_SUCCESS_LEN)
             self.end_headers()
-            self.wfile.write(b"""
-                <html>
-                <head><title>Authorization Successful</title></head>
-                <body>
-                    <h1>Authorization Successful!</h1>
-                    <p>You can close this window and return to the terminal.</p>
-                    <p>The authorization code has been captured automatically.</p>
-                </body>
-                </html>
-            """)
+            self.wfile.write(_OAUTH_SUCCESS_HTML)
         else:
             # Error case
             error = query_params.get('error', ['Unknown error'])[0]
+            body = _OAUTH_ERROR_HTML % html.escape(error).encode()
             self.send_response(400)
             self.send_header('Content-type', 'text/html')
+            self.send_header('Content-Length', str(len(body)))
             self.end_headers()
-            self.wfile.write(f"""
-                <html>
-                <head><title>Authorization Failed</title></head>
-                <body>
-                    <h1>Authorization Failed</h1>
-                    <p>Error: {error}</p>
-                    <p>Please check the terminal for instructions.</p>
-                </body>
-                </html>
-            """.encode())
+            self.wfile.write(body)
             self.server.authorization_code = None
             self.server.authorization_state = None
     
@@ -93,25 +164,26 @@ def start_google_oauth_server(port: int = 8081, timeout: int = 300) -> Tuple[Opt
     httpd = HTTPServer(server_address, GoogleOAuthRedirectHandler)
     httpd.authorization_code = None
     httpd.authorization_state = None
-    httpd.socket.settimeout(1.0)  # Set socket timeout for non-blocking behavior
     
     logger.info(f"Starting Google OAuth redirect server on port {port}...")
     logger.info("Waiting for authorization (timeout: {} seconds)...".format(timeout))
     
-    # Set a timeout for the server
-    start_time = time.time()
-    while httpd.authorization_code is None and (time.time() - start_time) < timeout:
-        try:
-            httpd.handle_request()
-            if httpd.authorization_code is not None:
+    # handle_request() blocks until a request arrives or httpd.timeout expires;
+    # loop because the browser may send other requests (e.g. favicon) first.
+    # The finally releases the port even when the wait is interrupted (Ctrl-C)
+    deadline = time.monotonic() + timeout
+    try:
+        while httpd.authorization_code is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 break
-        except socket.timeout:
-            # Timeout is expected, continue waiting
-            continue
+            httpd.timeout = remaining
+            httpd.handle_request()
+    finally:
+        httpd.server_close()
     
     code = httpd.authorization_code
     state = httpd.authorization_state
-    httpd.server_close()
     
     if code:
         logger.info("Authorization code captured successfully!")
@@ -122,10 +194,17 @@ def start_google_oauth_server(port: int = 8081, timeout: int = 300) -> Tuple[Opt
 
 
 def get_credentials() -> Credentials:
-    """Get or refresh YouTube OAuth credentials."""
-    # Set environment variable to allow HTTP for localhost (required for OAuth redirect)
-    os.environ['OAUTHLIB_INSECURE_TRANSPORT'] = '1'
-    
+    """Get or refresh YouTube OAuth credentials (serialized across threads)."""
+    with _credentials_lock:
+        creds = _credentials_cache["creds"]
+        if creds is None or not creds.valid:
+            creds = _get_credentials()
+            _credentials_cache["creds"] = creds
+        return creds
+
+
+def _get_credentials() -> Credentials:
+    """Load, refresh, or interactively authorize YouTube OAuth credentials."""
     token_file = config.YOUTUBE_TOKEN_FILE
     
     creds: Optional[Credentials] = None
@@ -138,7 +217,7 @@ def get_credentials() -> Credentials:
     if creds and creds.expired and creds.refresh_token:
         logger.info("Refreshing YouTube credentials...")
         try:
-            creds.refresh(Request())
+            creds.refresh(_auth_request)
             token_file.write_text(creds.to_json())
             return creds
         except RefreshError as e:
@@ -199,33 +278,7 @@ def get_credentials() -> Credentials:
     
     authorization_url = f"https://accounts.google.com/o/oauth2/auth?{urlencode(auth_params)}"
     
-    logger.error("\n" + "="*60)
-    logger.error("YouTube authorization required!")
-    logger.error("="*60)
-    logger.error("\nOPTION 1: Automatic (Recommended if using SSH port forwarding)")
-    logger.error("="*60)
-    logger.error("1. If connecting via SSH, set up port forwarding FIRST:")
-    logger.error(f"   ssh -L {port}:localhost:{port} user@remote-host")
-    logger.error("   (Run this in a separate terminal before running the script)")
-    logger.error("\n2. Visit this URL in your browser:")
-    logger.error(f"\n   {authorization_url}\n")
-    logger.error("3. Click 'Continue' on the Google authorization page.")
-    logger.error("4. The code will be captured automatically - you'll see a success page.")
-    logger.error("\n" + "="*60)
-    logger.error("OPTION 2: Manual (If port forwarding is not available)")
-    logger.error("="*60)
-    logger.error("1. Visit this URL in your browser:")
-    logger.error(f"\n   {authorization_url}\n")
-    logger.error("2. Click 'Continue' on the Google authorization page.")
-    logger.error("3. IMPORTANT: After clicking 'Continue', Google will redirect you.")
-    logger.error("   Even if you see an error page (like 'Connection refused'),")
-    logger.error("   LOOK AT YOUR BROWSER'S ADDRESS BAR - it will contain the code!")
-    logger.error("\n4. The URL will look like:")
-    logger.error(f"   http://127.0.0.1:{port}/?code=ABC123XYZ...&state=...")
-    logger.error("\n5. Copy everything after 'code=' until the next '&' (if any).")
-    logger.error("   Example: If URL is '...?code=ABC123&state=...', copy 'ABC123'")
-    logger.error("   Or paste the full URL - the script will extract the code automatically.")
-    logger.error("\n" + "="*60)
+    logger.error(_OAUTH_INSTRUCTIONS_TEMPLATE.format(port=port, authorization_url=authorization_url))
     
     # Try to start server and capture code automatically
     logger.info("\nAttempting to capture authorization code automatically...")
@@ -234,12 +287,8 @@ def get_credentials() -> Credentials:
     authorization_code, captured_state = start_google_oauth_server(port=port, timeout=300)
     
     # Verify state parameter matches for security
-    if captured_state and captured_state != state:
-        logger.warning(f"State parameter mismatch! Expected: {state}, Got: {captured_state}")
-        logger.warning("This could indicate a security issue. Proceeding with caution...")
-    
-    # Use captured state if available, otherwise use the one we generated
-    final_state = captured_state if captured_state else state
+    if captured_state and not secrets.compare_digest(captured_state, state):
+        raise OAuthStateError("OAuth state parameter mismatch; restart the authorization")
     
     # If automatic capture failed, fall back to manual input
     if not authorization_code:
@@ -261,10 +310,8 @@ def get_credentials() -> Credentials:
                 # Verify state parameter if present
                 if 'state' in query_params:
                     url_state = query_params['state'][0]
-                    if url_state != state:
-                        logger.warning(f"State parameter mismatch! Expected: {state}, Got: {url_state}")
-                        logger.warning("This could indicate a security issue. Proceeding with caution...")
-                    final_state = url_state
+                    if not secrets.compare_digest(url_state, state):
+                        raise OAuthStateError("OAuth state parameter mismatch; restart the authorization")
             else:
                 authorization_code = user_input
         else:
@@ -283,13 +330,17 @@ def get_credentials() -> Credentials:
         'grant_type': 'authorization_code'
     }
     
-    response = requests.post('https://oauth2.googleapis.com/token', data=token_data)
+    response = _session.post('https://oauth2.googleapis.com/token', data=token_data)
     response.raise_for_status()
     token_response = response.json()
     
+    # google-auth compares expiry against naive UTC time
+    expires_in = int(token_response.get('expires_in', 3600))
+    
     # Create Credentials object from token response
     creds = Credentials(
         token=token_response.get('access_token'),
+        expiry=datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(seconds=expires_in),
         refresh_token=token_response.get('refresh_token'),
         token_uri='https://oauth2.googleapis.com/token',
         client_id=config.YOUTUBE_CLIENT_ID,
@@ -302,6 +353,19 @@ def get_credentials() -> Credentials:
     return creds
 
 
+def _get_youtube_service(creds: Credentials):
+    """Return this thread's YouTube service, rebuilding it when the access token changes."""
+    cached = getattr(_service_local, "service", None)
+    if cached is not None and cached[0] == creds.token:
+        return cached[1]
+    
+    # googleapiclient is heavy to import; only load it once a service is needed
+    from googleapiclient.discovery import build
+    youtube = build("youtube", "v3", credentials=creds)
+    _service_local.service = (creds.token, youtube)
+    return youtube
+
+
 def upload_video(
     video_path: Path,
     title: str,
@@ -327,7 +391,7 @@ def upload_video(
     if description is None:
         description = config.YOUTUBE_DEFAULT_DESCRIPTION
     if tags is None:
-        tags = [t.strip() for t in config.YOUTUBE_DEFAULT_TAGS.split(",") if t.strip()]
+        tags = config.YOUTUBE_DEFAULT_TAGS_LIST
     if category_id is None:
         category_id = config.YOUTUBE_CATEGORY_ID
     
@@ -335,9 +399,16 @@ def upload_video(
     logger.info(f"Title: {title}")
     
     creds = get_credentials()
-    youtube = build("youtube", "v3", credentials=creds)
+    youtube = _get_youtube_service(creds)
     
-    media = MediaFileUpload(str(video_path), chunksize=4 * 1024 * 1024, resumable=True)
+    # Small files go up in a single request (chunksize=-1), still over the
+    # resumable protocol; larger ones are sent in configured chunks
+    if video_path.stat().st_size < SINGLE_REQUEST_UPLOAD_MAX_BYTES:
+        chunksize = -1
+    else:
+        chunksize = config.YOUTUBE_UPLOAD_CHUNK_SIZE
+    from googleapiclient.http import MediaFileUpload
+    media = MediaFileUpload(str(video_path), chunksize=chunksize, resumable=True)
     body = {
         "snippet": {
             "title": title,
@@ -352,10 +423,14 @@ def upload_video(
     request = youtube.videos().insert(part="snippet,status", body=body, media_body=media)
     
     response = None
+    last_logged_pct = 0.0
     while response is None:
         status, response = request.next_chunk()
         if status:
-            logger.info("Upload progress: %.2f%%", status.progress() * 100)
+            pct = status.progress() * 100
+            if pct - last_logged_pct >= UPLOAD_PROGRESS_LOG_STEP_PCT:
+                logger.info("Upload progress: %.2f%%", pct)
+                last_logged_pct = pct
     
     video_id = response["id"]
     youtube_url = f"https://youtu.be/{video_id}"
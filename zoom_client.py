@@ -1,16 +1,22 @@
 """Zoom API client for downloading cloud recordings."""
 import base64
+import html
+import itertools
 import logging
 import os
+import shutil
+import threading
 import urllib.parse
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 import time
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import config
 from gallery_identifier import find_best_gallery_view_file
@@ -25,6 +31,92 @@ except ImportError:
     DISCORD_AVAILABLE = False
     logger.warning("Discord client not available, error notifications will be skipped")
 
+class TokenExpiredError(Exception):
+    """The saved Zoom refresh token has expired or been revoked."""
+
+
+# Shared session so API calls and downloads reuse keep-alive TLS connections.
+# The pool holds one connection per parallel worker. Status retries only
+# apply to idempotent requests (the urllib3 default); Zoom rotates the refresh
+# token on every exchange, so token POSTs use the stricter adapter below.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=config.PARALLEL_WORKERS,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    ),
+))
+
+# Token POSTs get their own adapter (requests picks the longest matching
+# prefix). They are retried only when Zoom cannot have used the refresh token:
+# connection failures before the request is sent, and 429/503 responses.
+# Read errors are never retried, since Zoom may already have rotated the token.
+_session.mount("https://zoom.us/oauth/", HTTPAdapter(
+    max_retries=Retry(
+        total=3,
+        connect=3,
+        read=0,
+        status=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 503],
+        allowed_methods=["POST"],
+        raise_on_status=False,
+    ),
+))
+
+# Token endpoint headers depend only on the app credentials, so build them once
+_BASIC_AUTH_HEADER = "Basic " + base64.b64encode(
+    f"{config.ZOOM_CLIENT_ID}:{config.ZOOM_CLIENT_SECRET}".encode()
+).decode()
+_TOKEN_HEADERS = {
+    "Authorization": _BASIC_AUTH_HEADER,
+    "Content-Type": "application/x-www-form-urlencoded"
+}
+
+# Read size used when streaming recording downloads to disk
+DOWNLOAD_BLOCK_SIZE = 1024 * 1024
+
+# Maximum number of bytes of an error response body written to the log
+ERROR_BODY_LOG_LIMIT = 4096
+
+# Access tokens are reused until shortly before they expire (Zoom issues them for 1 hour)
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
+_token_cache = {"token": None, "expires_at": 0.0}
+# Only one thread may refresh at a time: Zoom rotates the refresh token on use
+_token_lock = threading.Lock()
+
+
+def _cache_access_token(token_data: dict) -> None:
+    """Remember an access token from a Zoom token response until just before it expires."""
+    expires_in = int(token_data.get("expires_in", 3600))
+    _token_cache["token"] = token_data.get("access_token")
+    _token_cache["expires_at"] = time.monotonic() + expires_in - TOKEN_EXPIRY_MARGIN_SECONDS
+
+
+def _get_cached_access_token() -> Optional[str]:
+    """Return the cached access token if it is still valid, None otherwise."""
+    cached_token = _token_cache["token"]
+    if cached_token and time.monotonic() < _token_cache["expires_at"]:
+        return cached_token
+    return None
+
+
+def invalidate_access_token() -> None:
+    """Drop the cached access token, e.g. after Zoom rejects it with a 401."""
+    # Clearing the token first keeps concurrent readers from using it, so
+    # callers may hold _token_lock or not
+    _token_cache["token"] = None
+    _token_cache["expires_at"] = 0.0
+
+
+def _post_token(data: dict) -> requests.Response:
+    """POST a grant to the Zoom OAuth token endpoint."""
+    return _session.post("https://zoom.us/oauth/token", headers=_TOKEN_HEADERS, data=data)
+
 
 def get_authorization_url() -> str:
     """Generate the authorization URL for user to visit."""
@@ -41,26 +133,19 @@ def exchange_code_for_tokens(authorization_code: str) -> Tuple[str, str]:
     """Exchange authorization code for access token and refresh token."""
     logger.info("Exchanging authorization code for tokens...")
     
-    credentials = f"{config.ZOOM_CLIENT_ID}:{config.ZOOM_CLIENT_SECRET}"
-    encoded_credentials = base64.b64encode(credentials.encode()).decode()
-    
-    headers = {
-        "Authorization": f"Basic {encoded_credentials}",
-        "Content-Type": "application/x-www-form-urlencoded"
-    }
-    
     data = {
         "grant_type": "authorization_code",
         "code": authorization_code,
         "redirect_uri": config.ZOOM_REDIRECT_URI
     }
     
-    response = requests.post("https://zoom.us/oauth/token", headers=headers, data=data)
+    response = _post_token(data)
     response.raise_for_status()
     
     token_data = response.json()
     access_token = token_data.get("access_token")
     refresh_token = token_data.get("refresh_token")
+    _cache_access_token(token_data)
     
     # Save refresh token for future use
     if refresh_token:
@@ -72,20 +157,12 @@ def exchange_code_for_tokens(authorization_code: str) -> Tuple[str, str]:
 
 def get_access_token_from_refresh(refresh_token: str) -> str:
     """Get a new access token using refresh token."""
-    credentials = f"{config.ZOOM_CLIENT_ID}:{config.ZOOM_CLIENT_SECRET}"
-    encoded_credentials = base64.b64encode(credentials.encode()).decode()
-    
-    headers = {
-        "Authorization": f"Basic {encoded_credentials}",
-        "Content-Type": "application/x-www-form-urlencoded"
-    }
-    
     data = {
         "grant_type": "refresh_token",
         "refresh_token": refresh_token
     }
     
-    response = requests.post("https://zoom.us/oauth/token", headers=headers, data=data)
+    response = _post_token(data)
     
     # Check for token expiration/revocation errors before raising
     if response.status_code != 200:
@@ -93,23 +170,21 @@ def get_access_token_from_refresh(refresh_token: str) -> str:
             error_data = response.json()
             error_code = error_data.get("error", "")
             error_description = error_data.get("error_description", "")
-            
-            # Check for token expiration/revocation errors
-            if error_code in ["invalid_grant", "invalid_token"] or "expired" in error_description.lower() or "revoked" in error_description.lower():
-                error_msg = f"{error_code}: {error_description}" if error_description else error_code
-                raise ValueError(f"Refresh token expired or revoked: {error_msg}")
-        except (ValueError, KeyError):
-            # If we can't parse the error or it's not a token expiration error, 
-            # let raise_for_status() handle it
-            # Note: ValueError here means we raised it ourselves for token expiration
-            # If response.json() fails, it will raise on the next call, which is fine
-            pass
+        except (ValueError, AttributeError):
+            # Not a JSON error object; let raise_for_status() handle it
+            error_code = error_description = ""
+        
+        # Check for token expiration/revocation errors
+        if error_code in ["invalid_grant", "invalid_token"] or "expired" in error_description.lower() or "revoked" in error_description.lower():
+            error_msg = f"{error_code}: {error_description}" if error_description else error_code
+            raise TokenExpiredError(f"Refresh token expired or revoked: {error_msg}")
     
     response.raise_for_status()
     
     token_data = response.json()
     access_token = token_data.get("access_token")
     new_refresh_token = token_data.get("refresh_token")
+    _cache_access_token(token_data)
     
     # Update refresh token if a new one is provided
     if new_refresh_token and new_refresh_token != refresh_token:
@@ -118,12 +193,44 @@ def get_access_token_from_refresh(refresh_token: str) -> str:
     return access_token
 
 
+# Redirect page bodies, built once at import
+_OAUTH_SUCCESS_HTML = b"""
+    <html>
+    <head><title>Authorization Successful</title></head>
+    <body>
+        <h1>Authorization Successful!</h1>
+        <p>You can close this window and return to the terminal.</p>
+        <p>The authorization code has been captured automatically.</p>
+    </body>
+    </html>
+"""
+_OAUTH_SUCCESS_LEN = str(len(_OAUTH_SUCCESS_HTML))
+_OAUTH_ERROR_HTML = b"""
+    <html>
+    <head><title>Authorization Failed</title></head>
+    <body>
+        <h1>Authorization Failed</h1>
+        <p>Error: %b</p>
+        <p>Please check the terminal for instructions.</p>
+    </body>
+    </html>
+"""
+
+
 class OAuthRedirectHandler(BaseHTTPRequestHandler):
     """HTTP request handler to capture OAuth redirect."""
     
     def do_GET(self):
         """Handle GET request from OAuth redirect."""
         parsed_path = urlparse(self.path)
+        
+        # Browsers probe for a favicon; answer it without touching the auth state
+        if parsed_path.path == '/favicon.ico':
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        
         query_params = parse_qs(parsed_path.query)
         
         if 'code' in query_params:
@@ -133,33 +240,18 @@ class OAuthRedirectHandler(BaseHTTPRequestHandler):
             # Send success response
             self.send_response(200)
             self.send_header('Content-type', 'text/html')
+            self.send_header('Content-Length', _OAUTH_SUCCESS_LEN)
             self.end_headers()
-            self.wfile.write(b"""
-                <html>
-                <head><title>Authorization Successful</title></head>
-                <body>
-                    <h1>Authorization Successful!</h1>
-                    <p>You can close this window and return to the terminal.</p>
-                    <p>The authorization code has been captured automatically.</p>
-                </body>
-                </html>
-            """)
+            self.wfile.write(_OAUTH_SUCCESS_HTML)
         else:
             # Error case
             error = query_params.get('error', ['Unknown error'])[0]
+            body = _OAUTH_ERROR_HTML % html.escape(error).encode()
             self.send_response(400)
             self.send_header('Content-type', 'text/html')
+            self.send_header('Content-Length', str(len(body)))
             self.end_headers()
-            self.wfile.write(f"""
-                <html>
-                <head><title>Authorization Failed</title></head>
-                <body>
-                    <h1>Authorization Failed</h1>
-                    <p>Error: {error}</p>
-                    <p>Please check the terminal for instructions.</p>
-                </body>
-                </html>
-            """.encode())
+            self.wfile.write(body)
             self.server.authorization_code = None
     
     def log_message(self, format, *args):
@@ -172,29 +264,28 @@ def start_oauth_server(port: int = 8080, timeout: int = 300) -> Optional[str]:
     Start a local HTTP server to capture OAuth redirect.
     Returns the authorization code if captured, None otherwise.
     """
-    import socket
-    
     server_address = ('', port)
     httpd = HTTPServer(server_address, OAuthRedirectHandler)
     httpd.authorization_code = None
-    httpd.socket.settimeout(1.0)  # Set socket timeout for non-blocking behavior
     
     logger.info(f"Starting OAuth redirect server on port {port}...")
     logger.info("Waiting for authorization (timeout: {} seconds)...".format(timeout))
     
-    # Set a timeout for the server
-    start_time = time.time()
-    while httpd.authorization_code is None and (time.time() - start_time) < timeout:
-        try:
-            httpd.handle_request()
-            if httpd.authorization_code is not None:
+    # handle_request() blocks until a request arrives or httpd.timeout expires;
+    # loop because the browser may send other requests (e.g. favicon) first.
+    # The finally releases the port even when the wait is interrupted (Ctrl-C)
+    deadline = time.monotonic() + timeout
+    try:
+        while httpd.authorization_code is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 break
-        except socket.timeout:
-            # Timeout is expected, continue waiting
-            continue
+            httpd.timeout = remaining
+            httpd.handle_request()
+    finally:
+        httpd.server_close()
     
     code = httpd.authorization_code
-    httpd.server_close()
     
     if code:
         logger.info("Authorization code captured successfully!")
@@ -206,6 +297,22 @@ def start_oauth_server(port: int = 8080, timeout: int = 300) -> Optional[str]:
 
 def get_access_token() -> str:
     """Get OAuth access token using refresh token or guide user through authorization."""
+    cached_token = _get_cached_access_token()
+    if cached_token:
+        logger.debug("Using cached Zoom access token")
+        return cached_token
+    
+    with _token_lock:
+        # Another thread may have refreshed while this one waited for the lock
+        cached_token = _get_cached_access_token()
+        if cached_token:
+            logger.debug("Using cached Zoom access token")
+            return cached_token
+        return _get_access_token()
+
+
+def _get_access_token() -> str:
+    """Refresh the access token or run the interactive authorization flow."""
     logger.info("Getting Zoom access token...")
     
     token_file = config.ZOOM_REFRESH_TOKEN_FILE
@@ -219,8 +326,8 @@ def get_access_token() -> str:
             access_token = get_access_token_from_refresh(refresh_token)
             logger.info("Access token obtained from refresh token")
             return access_token
-        except ValueError as e:
-            # Token expired or revoked (specific error from get_access_token_from_refresh)
+        except TokenExpiredError as e:
+            # Token expired or revoked
             error_str = str(e)
             logger.error("="*60)
             logger.error("Zoom refresh token has expired or been revoked!")
@@ -246,10 +353,10 @@ def get_access_token() -> str:
                 token_file.unlink()
                 logger.info("Removed invalid token file")
         except Exception as e:
-            # Other errors (network issues, etc.)
+            # Other errors (network issues, Zoom outages, etc.): the refresh token
+            # is still valid, so keep it and let the next run try again
             error_str = str(e)
             logger.warning(f"Refresh token failed: {error_str}")
-            logger.info("Need to re-authorize...")
             
             # Send Discord notification for other token errors too
             if DISCORD_AVAILABLE:
@@ -261,8 +368,7 @@ def get_access_token() -> str:
                 except Exception as discord_error:
                     logger.warning(f"Failed to send Discord notification: {discord_error}")
             
-            if token_file.exists():
-                token_file.unlink()
+            raise
     
     # No valid refresh token, need to get authorization code
     auth_url = get_authorization_url()
@@ -335,20 +441,49 @@ def get_access_token() -> str:
     return access_token
 
 
-def list_recordings(
+def _authorized_get(url: str, access_token: str, headers: Optional[dict] = None, **kwargs) -> Tuple[requests.Response, str]:
+    """
+    GET a Zoom URL with a bearer token, retrying once with a fresh token on 401.
+    
+    Args:
+        url: URL to fetch
+        access_token: Zoom access token to try first
+        headers: Extra request headers
+        **kwargs: Passed through to the session's get()
+    
+    Returns:
+        Tuple of (response, access token that produced it)
+    """
+    request_headers = dict(headers or {})
+    request_headers["Authorization"] = f"Bearer {access_token}"
+    response = _session.get(url, headers=request_headers, **kwargs)
+    if response.status_code != 401:
+        return response, access_token
+    
+    logger.warning("Zoom rejected the access token (401), refreshing it and retrying once")
+    response.close()
+    with _token_lock:
+        # Only drop the token if another thread hasn't already replaced it
+        if _token_cache["token"] == access_token:
+            invalidate_access_token()
+    access_token = get_access_token()
+    request_headers = {**request_headers, "Authorization": f"Bearer {access_token}"}
+    response = _session.get(url, headers=request_headers, **kwargs)
+    return response, access_token
+
+
+def iter_recordings(
     access_token: str,
-    limit: Optional[int] = None,
     from_date: Optional[str] = None,
     to_date: Optional[str] = None,
     page_size: int = 30
-) -> List[dict]:
-    """List recordings for the user."""
-    logger.info("Fetching recordings from Zoom...")
+) -> Iterator[dict]:
+    """
+    Yield recordings for the user, newest first, fetching pages as they are consumed.
     
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json"
-    }
+    Stopping iteration early skips the remaining pages.
+    """
+    headers = {"Content-Type": "application/json"}
     
     url = f"https://zoom.us/v2/users/{config.ZOOM_USER_ID}/recordings"
     params = {"page_size": page_size}
@@ -359,65 +494,71 @@ def list_recordings(
     if to_date:
         params["to"] = to_date
     
-    response = requests.get(url, headers=headers, params=params)
+    response, access_token = _authorized_get(url, access_token, headers=headers, params=params)
     
     if response.status_code != 200:
         logger.error(f"Error: {response.status_code}")
-        logger.error(f"Response: {response.text}")
+        body = response.content[:ERROR_BODY_LOG_LIMIT].decode("utf-8", "replace")
+        logger.error(f"Response (truncated): {body}")
         response.raise_for_status()
     
     data = response.json()
     recordings = data.get("meetings", [])
     
     logger.info(f"Found {len(recordings)} recordings in this page")
+    yield from recordings
     
     # Handle pagination if next_page_token exists
-    all_recordings = recordings.copy()
     next_page_token = data.get("next_page_token")
     page_number = 1
     
     while next_page_token:
         logger.debug(f"Fetching page {page_number + 1}...")
-        next_params = {"page_size": page_size, "next_page_token": next_page_token}
-        if from_date:
-            next_params["from"] = from_date
-        if to_date:
-            next_params["to"] = to_date
-            
-        response = requests.get(url, headers=headers, params=next_params)
+        next_params = {**params, "next_page_token": next_page_token}
+        
+        response, access_token = _authorized_get(url, access_token, headers=headers, params=next_params)
         response.raise_for_status()
         
         page_data = response.json()
         page_recordings = page_data.get("meetings", [])
-        all_recordings.extend(page_recordings)
         next_page_token = page_data.get("next_page_token")
         page_number += 1
         
         logger.debug(f"Found {len(page_recordings)} recordings in page {page_number}")
+        yield from page_recordings
+
+
+def list_recordings(
+    access_token: str,
+    limit: Optional[int] = None,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    page_size: int = 30
+) -> List[dict]:
+    """List recordings for the user, fetching only as many pages as limit needs."""
+    logger.info("Fetching recordings from Zoom...")
     
-    if page_number > 1:
-        logger.info(f"Total recordings across all pages: {len(all_recordings)}")
-    
-    # Apply limit if specified
-    if limit:
-        all_recordings = all_recordings[:limit]
+    recordings = iter_recordings(access_token, from_date=from_date, to_date=to_date, page_size=page_size)
+    all_recordings = list(itertools.islice(recordings, limit or None))
     
+    logger.info(f"Total recordings fetched: {len(all_recordings)}")
     return all_recordings
 
 
+# Recording file types that are not videos (audio, transcripts, chat, etc.)
+NON_VIDEO_RECORDING_TYPES = frozenset({
+    'audio_only',
+    'timeline',
+    'audio_transcript',
+    'chat_file',
+    'closed_caption',
+})
+
+
 def is_video_file(recording_file: dict) -> bool:
     """Check if a recording file is a video file (not audio, transcript, etc.)."""
     recording_type = recording_file.get("recording_type", "").lower()
-    
-    skip_types = [
-        'audio_only',
-        'timeline',
-        'audio_transcript',
-        'chat_file',
-        'closed_caption'
-    ]
-    
-    return recording_type not in skip_types
+    return recording_type not in NON_VIDEO_RECORDING_TYPES
 
 
 def find_best_video(recording_files: List[dict]) -> Optional[dict]:
@@ -428,25 +569,34 @@ def find_best_video(recording_files: List[dict]) -> Optional[dict]:
     return find_best_gallery_view_file(recording_files)
 
 
+# Characters not allowed in filenames, each replaced by '_' in one translate pass
+_SANITIZE_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+
 def sanitize_filename(name: str) -> str:
     """Sanitize a string to be safe for use as a filename."""
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        name = name.replace(char, '_')
-    name = name.strip(' .')
+    name = name.translate(_SANITIZE_TABLE).strip(' .')
     if len(name) > 200:
         name = name[:200]
     return name
 
 
-def generate_folder_name(recording: dict, template: str = "{date} {time} - {topic}") -> str:
-    """Generate folder name for a recording based on template."""
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a Zoom ISO 8601 timestamp (Python 3.10's fromisoformat rejects a 'Z' suffix)."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def generate_folder_name(recording: dict, template: Optional[str] = None) -> str:
+    """Generate folder name for a recording based on template (defaults to config value)."""
+    if template is None:
+        template = config.FOLDER_NAME_TEMPLATE
+    
     meeting_topic = recording.get('topic', 'Untitled Meeting')
     start_time = recording.get('start_time', '')
     
     # Parse start_time
     try:
-        dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+        dt = _parse_timestamp(start_time)
         date_str = dt.strftime("%Y-%m-%d")
         time_str = dt.strftime("%H-%M")
         date_time_str = f"{date_str} {time_str}"
@@ -472,18 +622,16 @@ def download_video(download_url: str, access_token: str, output_path: Path) -> N
     """Download a video file."""
     logger.info(f"Downloading to {output_path}...")
     
-    headers = {
-        "Authorization": f"Bearer {access_token}"
-    }
-    
-    response = requests.get(download_url, headers=headers, stream=True, timeout=300)
+    response, _ = _authorized_get(download_url, access_token, stream=True, timeout=300)
     response.raise_for_status()
     
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
+    # Copy the raw stream in 1 MiB blocks instead of many small iter_content chunks;
+    # decode_content keeps any Content-Encoding handled as iter_content did
+    response.raw.decode_content = True
     with open(output_path, 'wb') as f:
-        for chunk in response.iter_content(chunk_size=8192):
-            f.write(chunk)
+        shutil.copyfileobj(response.raw, f, length=DOWNLOAD_BLOCK_SIZE)
     
     file_size = output_path.stat().st_size
     logger.info(f"Downloaded {file_size / (1024*1024):.2f} MB")
@@ -506,8 +654,8 @@ def get_recording_duration_seconds(recording: dict, video_file: Optional[dict] =
             file_end = video_file.get('recording_end')
             
             if file_start and file_end:
-                start_dt = datetime.fromisoformat(file_start.replace('Z', '+00:00'))
-                end_dt = datetime.fromisoformat(file_end.replace('Z', '+00:00'))
+                start_dt = _parse_timestamp(file_start)
+                end_dt = _parse_timestamp(file_end)
                 return int((end_dt - start_dt).total_seconds())
         except (ValueError, AttributeError, TypeError):
             pass